@@ -0,0 +1,116 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from whisper_dictate import config, llm_cleanup
+
+
+class FakeParent:
+    """Stand-in for ``Path.parent`` that records ``mkdir`` calls."""
+
+    def __init__(self) -> None:
+        self.mkdir_calls: list[dict[str, Any]] = []
+        self.mkdir_error: Exception | None = None
+
+    def mkdir(self, **kwargs: Any) -> None:
+        self.mkdir_calls.append(kwargs)
+        if self.mkdir_error is not None:
+            raise self.mkdir_error
+
+
+class FakePath:
+    """Lightweight in-memory double for the settings file ``Path``.
+
+    Only implements the attributes the settings store touches, and records
+    calls in plain lists so tests can assert on them.
+    """
+
+    def __init__(self, content: str | bytes | None = None) -> None:
+        self.content = content
+        self.parent = FakeParent()
+        self.read_error: Exception | None = None
+        self.write_error: Exception | None = None
+        self.read_calls: list[dict[str, Any]] = []
+        self.write_calls: list[tuple[str | bytes, dict[str, Any]]] = []
+
+    @property
+    def written(self) -> str | bytes:
+        """Return the data passed to the most recent write."""
+        return self.write_calls[-1][0]
+
+    def read_bytes(self) -> bytes:
+        content = self._read({})
+        return content.encode("utf-8") if isinstance(content, str) else content
+
+    def read_text(self, **kwargs: Any) -> str:
+        content = self._read(kwargs)
+        return content.decode("utf-8") if isinstance(content, bytes) else content
+
+    def write_bytes(self, data: bytes) -> None:
+        self._write(data, {})
+
+    def write_text(self, data: str, **kwargs: Any) -> None:
+        self._write(data, kwargs)
+
+    def _read(self, kwargs: dict[str, Any]) -> str | bytes:
+        self.read_calls.append(kwargs)
+        if self.read_error is not None:
+            raise self.read_error
+        if self.content is None:
+            raise FileNotFoundError("No such file")
+        return self.content
+
+    def _write(self, data: str | bytes, kwargs: dict[str, Any]) -> None:
+        self.write_calls.append((data, kwargs))
+        if self.write_error is not None:
+            raise self.write_error
+        self.content = data
+
+
+@pytest.fixture
+def fake_settings_path() -> FakePath:
+    """Return an empty in-memory settings path (file does not exist yet)."""
+    return FakePath()
+
+
+@pytest.fixture(scope="session")
+def _whisper_model_session() -> MagicMock:
+    """Single WhisperModel stand-in shared across the test session."""
+    return MagicMock()
+
+
+@pytest.fixture
+def whisper_model_stub(_whisper_model_session: MagicMock) -> MagicMock:
+    """Return the shared model stub, reset and configured to produce no segments."""
+    model = _whisper_model_session
+    model.reset_mock(return_value=True, side_effect=True)
+    model.transcribe.return_value = ([], {})
+    return model
+
+
+@pytest.fixture(autouse=True)
+def _clear_llm_client_cache():
+    """Keep cached LLM clients from leaking between tests that patch ``OpenAI``."""
+    llm_cleanup.clear_client_cache()
+    yield
+    llm_cleanup.clear_client_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_compute_type_caches():
+    """Forget device capabilities so tests can fake different CTranslate2 answers."""
+    caches = (
+        config._supported_compute_types,
+        config.default_compute_type,
+        config.get_default_compute,
+    )
+    for cache in caches:
+        cache.cache_clear()
+    yield
+    for cache in caches:
+        cache.cache_clear()
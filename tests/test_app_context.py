@@ -1,5 +1,9 @@
 """Tests for app_context.py - Active window detection and context formatting."""
 
+import ctypes
+import ctypes.wintypes
+import sys
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -56,6 +60,29 @@ class TestFormatContextForPrompt:
         assert "window: Document - Word" in fragment
         assert "Cursor position at screen coordinates x=120, y=340" in fragment
 
+    def test_format_context_with_all_fields_exact(self):
+        """Test the exact rendering for the common fully-populated context."""
+        ctx = app_context.ActiveContext(
+            window_title="Document - Word",
+            process_name="winword.exe",
+            cursor_position=(120, 340),
+        )
+
+        assert app_context.format_context_for_prompt(ctx) == (
+            "Active application: winword.exe (window: Document - Word). "
+            "Cursor position at screen coordinates x=120, y=340."
+        )
+
+    def test_format_context_with_window_and_cursor(self):
+        """Test formatting context with window title and cursor but no process."""
+        ctx = app_context.ActiveContext(
+            window_title="Untitled", process_name=None, cursor_position=(1, 2)
+        )
+
+        assert app_context.format_context_for_prompt(ctx) == (
+            "Active window: Untitled. Cursor position at screen coordinates x=1, y=2."
+        )
+
     def test_format_context_with_process_only(self):
         """Test formatting context with only process name."""
         ctx = app_context.ActiveContext(
@@ -111,12 +138,29 @@ class TestFormatContextForPrompt:
         assert fragment is None
 
 
+class TestConfigurePrototypes:
+    """Tests for Win32 function prototype declarations."""
+
+    def test_configure_prototypes_declares_handle_types(self):
+        """Test that handle-returning and handle-taking calls use pointer-sized types."""
+        mock_user32 = MagicMock()
+        mock_kernel32 = MagicMock()
+
+        app_context._configure_prototypes(mock_user32, mock_kernel32)
+
+        assert mock_user32.GetForegroundWindow.restype is ctypes.wintypes.HWND
+        assert mock_user32.GetWindowTextW.argtypes[0] is ctypes.wintypes.HWND
+        assert mock_user32.GetWindowThreadProcessId.argtypes[0] is ctypes.wintypes.HWND
+        assert mock_kernel32.OpenProcess.restype is ctypes.wintypes.HANDLE
+        assert mock_kernel32.QueryFullProcessImageNameW.argtypes[0] is ctypes.wintypes.HANDLE
+        assert mock_kernel32.CloseHandle.argtypes == [ctypes.wintypes.HANDLE]
+
+
 class TestGetActiveContextNonWindows:
     """Tests for get_active_context on non-Windows platforms."""
 
     def test_get_active_context_no_windows(self, monkeypatch):
         """Test that get_active_context returns None on non-Windows platforms."""
-        monkeypatch.setattr(app_context.platform, "system", lambda: "Linux")
         monkeypatch.setattr(app_context, "USER32", None)
         monkeypatch.setattr(app_context, "KERNEL32", None)
 
@@ -224,8 +268,8 @@ class TestGetWindowTitle:
         """Test that empty title returns None."""
         mock_user32 = MagicMock()
 
-        # Mock GetWindowTextLengthW to return 0
-        mock_user32.GetWindowTextLengthW.return_value = 0
+        # GetWindowTextW copies nothing for an empty title
+        mock_user32.GetWindowTextW.return_value = 0
 
         monkeypatch.setattr(app_context, "USER32", mock_user32)
 
@@ -253,6 +297,39 @@ class TestGetWindowTitle:
 
         assert result is None
 
+    def test_get_window_title_skips_length_query_for_short_titles(self, monkeypatch):
+        """Test that short titles are read with a single API call."""
+        mock_user32 = MagicMock()
+
+        def mock_get_window_text(hwnd, buffer, max_count):
+            buffer[:6] = "Title\0"
+            return 5
+
+        mock_user32.GetWindowTextW.side_effect = mock_get_window_text
+        monkeypatch.setattr(app_context, "USER32", mock_user32)
+
+        assert app_context._get_window_title(12345) == "Title"
+        mock_user32.GetWindowTextLengthW.assert_not_called()
+
+    def test_get_window_title_long_title_uses_exact_buffer(self, monkeypatch):
+        """Test that a possibly truncated title is re-read with an exact-size buffer."""
+        mock_user32 = MagicMock()
+        long_title = "x" * (app_context.TITLE_BUFFER_CHARS + 100)
+        mock_user32.GetWindowTextLengthW.return_value = len(long_title)
+
+        def mock_get_window_text(hwnd, buffer, max_count):
+            text = long_title[: max_count - 1]
+            for i, char in enumerate(text):
+                buffer[i] = char
+            buffer[len(text)] = "\0"
+            return len(text)
+
+        mock_user32.GetWindowTextW.side_effect = mock_get_window_text
+        monkeypatch.setattr(app_context, "USER32", mock_user32)
+
+        assert app_context._get_window_title(12345) == long_title
+        assert mock_user32.GetWindowTextW.call_count == 2
+
     def test_get_window_title_api_failure(self, monkeypatch):
         """Test that API failure returns None."""
         mock_user32 = MagicMock()
@@ -270,6 +347,37 @@ class TestGetWindowTitle:
 class TestGetProcessName:
     """Tests for _get_process_name helper function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_process_cache(self, monkeypatch):
+        monkeypatch.setattr(app_context, "_PROCESS_NAME_CACHE", {})
+
+    @staticmethod
+    def _mock_apis(monkeypatch, pid=1234, path=r"C:\Windows\System32\notepad.exe"):
+        from pathlib import PureWindowsPath
+
+        mock_user32 = MagicMock()
+        mock_kernel32 = MagicMock()
+        current_pid = {"value": pid}
+
+        def mock_get_thread_id(hwnd, pid_ref):
+            pid_ref._obj.value = current_pid["value"]
+            return 1
+
+        def mock_query_name(handle, flags, buffer, size_ref):
+            for i, char in enumerate(path):
+                buffer[i] = char
+            buffer[len(path)] = "\0"
+            return True
+
+        mock_user32.GetWindowThreadProcessId.side_effect = mock_get_thread_id
+        mock_kernel32.OpenProcess.return_value = 99999
+        mock_kernel32.QueryFullProcessImageNameW.side_effect = mock_query_name
+
+        monkeypatch.setattr("whisper_dictate.app_context.Path", PureWindowsPath)
+        monkeypatch.setattr(app_context, "USER32", mock_user32)
+        monkeypatch.setattr(app_context, "KERNEL32", mock_kernel32)
+        return mock_kernel32, current_pid
+
     def test_get_process_name_success(self, monkeypatch):
         """Test successful process name retrieval."""
         from pathlib import PureWindowsPath
@@ -352,6 +460,63 @@ class TestGetProcessName:
         # Verify CloseHandle was still called
         mock_kernel32.CloseHandle.assert_called_once_with(99999)
 
+    def test_get_process_name_reuses_cached_lookup(self, monkeypatch):
+        """Test that a repeat lookup for the same window and pid skips OpenProcess."""
+        mock_kernel32, _ = self._mock_apis(monkeypatch)
+
+        assert app_context._get_process_name(12345) == "notepad.exe"
+        assert app_context._get_process_name(12345) == "notepad.exe"
+
+        mock_kernel32.OpenProcess.assert_called_once()
+
+    def test_get_process_name_requeries_when_pid_changes(self, monkeypatch):
+        """Test that a reused window handle with a new pid is looked up again."""
+        mock_kernel32, current_pid = self._mock_apis(monkeypatch)
+
+        app_context._get_process_name(12345)
+        current_pid["value"] = 5678
+        app_context._get_process_name(12345)
+
+        assert mock_kernel32.OpenProcess.call_count == 2
+
+    def test_process_name_cache_is_bounded(self, monkeypatch):
+        """Test that the cache evicts the oldest window past its size limit."""
+        self._mock_apis(monkeypatch)
+
+        for hwnd in range(app_context.PROCESS_NAME_CACHE_SIZE + 1):
+            app_context._get_process_name(hwnd + 1)
+
+        assert len(app_context._PROCESS_NAME_CACHE) == app_context.PROCESS_NAME_CACHE_SIZE
+        assert 1 not in app_context._PROCESS_NAME_CACHE
+
+    def test_process_name_cache_survives_concurrent_eviction(self):
+        """Test that overlapping workers can fill and evict the cache at the same time."""
+        errors = []
+        start = threading.Barrier(8)
+
+        def worker(offset):
+            start.wait()
+            try:
+                for hwnd in range(offset, offset + 20000):
+                    app_context._cache_process_name(hwnd, hwnd, "app.exe")
+            except Exception as e:  # pragma: no cover - only reached on a race
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i * 100000,)) for i in range(8)]
+        # Switch threads as often as possible so an unguarded evict-then-delete races
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert errors == []
+        assert len(app_context._PROCESS_NAME_CACHE) == app_context.PROCESS_NAME_CACHE_SIZE
+
 
 class TestGetCursorPosition:
     """Tests for _get_cursor_position helper function."""
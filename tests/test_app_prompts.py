@@ -1,6 +1,7 @@
 """Tests for per-application prompt resolution."""
 
 import re
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -298,6 +299,16 @@ class TestCloneRules:
         assert original["app.exe"][0]["prompt"] == "Original"
         assert "new.exe" not in original
 
+    def test_clone_rules_copies_rule_lists(self):
+        """Test that adding rules to a cloned process leaves the source untouched."""
+        original = {"app.exe": [{"prompt": "Original"}]}
+        cloned = app_prompts.clone_rules(original)
+
+        cloned["app.exe"].append({"prompt": "Extra"})
+
+        assert original == {"app.exe": [{"prompt": "Original"}]}
+        assert cloned["app.exe"][0] is not original["app.exe"][0]
+
     def test_clone_rules_empty_map(self):
         """Test cloning empty rules map."""
         original = {}
@@ -318,6 +329,22 @@ class TestRegexValidation:
         app_prompts.validate_regex_pattern("(group)")
         app_prompts.validate_regex_pattern("[a-z]+")
 
+    @pytest.mark.parametrize(
+        "pattern",
+        ["simple", "^Inbox \\- Outlook$", "\\*literal\\+", "(?i)title", "(?:group)"],
+    )
+    def test_validate_regex_pattern_reports_linear(self, pattern):
+        """Test that patterns without backtracking constructs are reported linear."""
+        assert app_prompts.validate_regex_pattern(pattern) is True
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [".*\\.txt", "[a-z]+", "a?b", "a{2}", "foo|bar", "(a)\\1", "(?P<x>a)(?P=x)", "\\(?x"],
+    )
+    def test_validate_regex_pattern_reports_backtracking(self, pattern):
+        """Test that quantifiers, alternation and backreferences are not linear."""
+        assert app_prompts.validate_regex_pattern(pattern) is False
+
     def test_validate_regex_pattern_too_long(self):
         """Test rejection of overly long patterns."""
         long_pattern = "a" * (app_prompts.MAX_REGEX_LENGTH + 1)
@@ -353,12 +380,50 @@ class TestRegexValidation:
 class TestSafeRegexSearch:
     """Test safe regex searching with timeout protection."""
 
+    def test_safe_regex_search_reuses_compiled_pattern(self):
+        """Test that repeated searches compile each pattern only once."""
+        app_prompts._compile_cached.cache_clear()
+
+        app_prompts.safe_regex_search("Inbox", "Inbox - Outlook")
+        app_prompts.safe_regex_search("Inbox", "Inbox - Mail")
+
+        info = app_prompts._compile_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits >= 1
+
     def test_safe_regex_search_match(self):
         """Test safe regex search with matching pattern."""
         assert app_prompts.safe_regex_search("hello", "hello world") is True
         assert app_prompts.safe_regex_search("HELLO", "hello world") is True  # Case insensitive
         assert app_prompts.safe_regex_search(".*world", "hello world") is True
 
+    def test_safe_regex_search_linear_pattern_skips_thread(self, monkeypatch):
+        """Test that linear patterns are matched inline without a watchdog thread."""
+        thread_cls = MagicMock()
+        monkeypatch.setattr(app_prompts.threading, "Thread", thread_cls)
+
+        assert app_prompts.safe_regex_search("^Inbox", "inbox - Outlook") is True
+        assert app_prompts.safe_regex_search("Drafts", "Inbox - Outlook") is False
+        thread_cls.assert_not_called()
+
+    def test_safe_regex_search_without_regex_engine_uses_thread(self, monkeypatch):
+        """Test that the watchdog-thread fallback is used when `regex` is missing."""
+        monkeypatch.setattr(app_prompts, "_regex", None)
+
+        assert app_prompts.safe_regex_search(".*world", "hello world") is True
+        assert app_prompts.safe_regex_search("goodbye.*", "hello world") is False
+
+    def test_safe_regex_search_engine_timeout_returns_false(self, monkeypatch):
+        """Test that a native engine timeout fails safe."""
+        if app_prompts._regex is None:
+            pytest.skip("regex package not installed")
+        compiled = MagicMock()
+        compiled.search.side_effect = TimeoutError("regex timed out")
+        monkeypatch.setattr(app_prompts, "_compile_with_timeout_engine", lambda pattern: compiled)
+
+        assert app_prompts.safe_regex_search(".*world", "hello world", timeout=0.1) is False
+        assert compiled.search.call_args.kwargs["timeout"] == 0.1
+
     def test_safe_regex_search_no_match(self):
         """Test safe regex search with non-matching pattern."""
         assert app_prompts.safe_regex_search("goodbye", "hello world") is False
@@ -431,3 +496,90 @@ class TestResolveAppPromptWithSafeRegex:
         # Should return None (pattern validation fails)
         result = app_prompts.resolve_app_prompt(rules, context)
         assert result is None
+
+
+class TestCompileAppPrompts:
+    """Test ingest-time compilation of app prompt rules."""
+
+    def test_compile_app_prompts_attaches_compiled_pattern(self):
+        """Test that rules carry a compiled pattern and the map stays serializable."""
+        rules = {"chrome.exe": [{"prompt": "Docs", "window_title_regex": "Google Docs"}]}
+
+        compiled = app_prompts.compile_app_prompts(rules)
+
+        rule = compiled.rules["chrome.exe"].regex_rules[0]
+        assert rule.compiled is app_prompts._compile_cached("Google Docs", re.IGNORECASE)
+        assert rule.linear is True
+        assert rules == {"chrome.exe": [{"prompt": "Docs", "window_title_regex": "Google Docs"}]}
+
+    def test_compile_app_prompts_splits_default_from_regex_rules(self):
+        """Test that the first regex-less rule becomes the process default."""
+        rules = {
+            "code.exe": [
+                {"prompt": "General"},
+                {"prompt": "Python", "window_title_regex": r"\.py"},
+                {"prompt": "Second default"},
+            ]
+        }
+
+        compiled = app_prompts.compile_app_prompts(rules).rules["code.exe"]
+
+        assert compiled.default_prompt == "General"
+        assert [rule.prompt for rule in compiled.regex_rules] == ["Python"]
+        assert isinstance(compiled.regex_rules, tuple)
+
+    def test_compile_app_prompts_invalid_regex_never_matches(self):
+        """Test that rejected patterns are dropped."""
+        rules = {
+            "notepad.exe": [
+                {"prompt": "Broken", "window_title_regex": "(a+)+"},
+                {"prompt": "Default"},
+            ]
+        }
+
+        compiled = app_prompts.compile_app_prompts(rules)
+        ctx = _make_context("notepad.exe", "aaaa")
+
+        assert compiled.rules["notepad.exe"].regex_rules == ()
+        assert app_prompts.resolve_compiled_app_prompt(compiled, ctx) == "Default"
+
+    def test_resolve_compiled_app_prompt_ignores_process_case(self):
+        """Test that process names match regardless of casing."""
+        compiled = app_prompts.compile_app_prompts({"Chrome.exe": [{"prompt": "Browser"}]})
+
+        ctx = _make_context("CHROME.EXE", "Any tab")
+
+        assert app_prompts.resolve_compiled_app_prompt(compiled, ctx) == "Browser"
+
+    def test_resolve_compiled_app_prompt_does_not_revalidate(self, monkeypatch):
+        """Test that resolving against compiled rules skips validation."""
+        compiled = app_prompts.compile_app_prompts(
+            {"chrome.exe": [{"prompt": "Docs", "window_title_regex": "Docs"}]}
+        )
+        validate = MagicMock()
+        monkeypatch.setattr(app_prompts, "validate_regex_pattern", validate)
+        ctx = _make_context("chrome.exe", "Google Docs")
+
+        assert app_prompts.resolve_compiled_app_prompt(compiled, ctx) == "Docs"
+        validate.assert_not_called()
+
+    def test_compiled_app_prompts_caches_matches(self):
+        """Test that repeated lookups for the same window skip the regex search."""
+        rules = MagicMock()
+        rules.resolve.return_value = "Docs"
+        compiled = app_prompts.CompiledAppPrompts({"chrome.exe": rules})
+        ctx = _make_context("chrome.exe", "Google Docs")
+
+        assert app_prompts.resolve_compiled_app_prompt(compiled, ctx) == "Docs"
+        assert app_prompts.resolve_compiled_app_prompt(compiled, ctx) == "Docs"
+
+        rules.resolve.assert_called_once_with("Google Docs")
+
+    def test_recompiling_drops_cached_matches(self):
+        """Test that a new compiled map does not reuse results from the old one."""
+        ctx = _make_context("chrome.exe", "Google Docs")
+        old = app_prompts.compile_app_prompts({"chrome.exe": [{"prompt": "Old"}]})
+        new = app_prompts.compile_app_prompts({"chrome.exe": [{"prompt": "New"}]})
+
+        assert app_prompts.resolve_compiled_app_prompt(old, ctx) == "Old"
+        assert app_prompts.resolve_compiled_app_prompt(new, ctx) == "New"
@@ -1,5 +1,6 @@
 """Tests for audio recording functionality."""
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -33,11 +34,47 @@ class TestAudioRecorder:
         recorder = AudioRecorder()
         recorder.start()
         recorder.stop()
+        recorder._wait_for_teardown()
 
         assert recorder.is_recording() is False
         mock_stream.stop.assert_called_once()
         mock_stream.close.assert_called_once()
 
+    @patch("whisper_dictate.audio.sd.InputStream")
+    def test_stop_does_not_wait_for_stream_close(self, mock_stream_class):
+        """Test that stop() returns while the driver is still releasing the stream."""
+        release = threading.Event()
+        mock_stream = MagicMock()
+        mock_stream.close.side_effect = lambda: release.wait(timeout=5)
+        mock_stream_class.return_value = mock_stream
+
+        recorder = AudioRecorder()
+        recorder.start()
+        recorder.stop()
+
+        assert recorder.is_recording() is False
+        assert recorder._teardown_thread.is_alive()
+        release.set()
+        recorder._wait_for_teardown()
+        mock_stream.close.assert_called_once()
+
+    @patch("whisper_dictate.audio.sd.InputStream")
+    def test_start_waits_for_previous_stream_teardown(self, mock_stream_class):
+        """Test that a new stream is only opened after the old one is closed."""
+        events = []
+        old_stream = MagicMock()
+        old_stream.close.side_effect = lambda: events.append("closed")
+        new_stream = MagicMock()
+        new_stream.start.side_effect = lambda: events.append("started")
+        mock_stream_class.side_effect = [old_stream, new_stream]
+
+        recorder = AudioRecorder()
+        recorder.start()
+        recorder.stop()
+        recorder.start()
+
+        assert events == ["closed", "started"]
+
     def test_get_buffer_empty(self):
         """Test getting audio buffer when empty."""
         recorder = AudioRecorder()
@@ -52,9 +89,8 @@ class TestAudioRecorder:
         test_data1 = np.array([0.1, 0.2, 0.3], dtype=np.float32)
         test_data2 = np.array([0.4, 0.5], dtype=np.float32)
 
-        with recorder._buffer_lock:
-            recorder._audio_buffer.append(test_data1)
-            recorder._audio_buffer.append(test_data2)
+        recorder._audio_callback(test_data1, 3, {}, None)
+        recorder._audio_callback(test_data2, 2, {}, None)
 
         result = recorder.get_buffer()
 
@@ -72,8 +108,8 @@ class TestAudioRecorder:
         indata_mono = np.array([0.1, 0.2, 0.3])
         recorder._audio_callback(indata_mono, 3, {}, None)
 
-        # Check that data was queued
-        assert not recorder._audio_queue.empty()
+        # Check that data was written to the buffer
+        np.testing.assert_allclose(recorder.get_buffer(), [0.1, 0.2, 0.3], rtol=1e-6)
 
     def test_audio_callback_stereo(self):
         """Test audio callback with stereo input (should be averaged to mono)."""
@@ -82,10 +118,52 @@ class TestAudioRecorder:
         indata_stereo = np.array([[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]])
         recorder._audio_callback(indata_stereo, 3, {}, None)
 
-        # Check that data was queued
-        assert not recorder._audio_queue.empty()
-        queued_data = recorder._audio_queue.get_nowait()
-        assert len(queued_data) == 3  # Should be mono
+        result = recorder.get_buffer()
+        assert len(result) == 3  # Should be mono
+        np.testing.assert_allclose(result, [0.15, 0.35, 0.55], rtol=1e-6)
+
+    def test_audio_callback_single_channel_2d(self):
+        """Test that (frames, 1) input from sounddevice is copied without averaging."""
+        recorder = AudioRecorder()
+
+        indata = np.array([[0.1], [0.2], [0.3]], dtype=np.float32)
+        recorder._audio_callback(indata, 3, {}, None)
+
+        np.testing.assert_array_equal(recorder.get_buffer(), indata[:, 0])
+
+    def test_audio_callback_grows_buffer(self):
+        """Test that recordings longer than the preallocated buffer are kept whole."""
+        recorder = AudioRecorder()
+        capacity = len(recorder._buffer)
+        chunk = np.ones(capacity // 2 + 1, dtype=np.float32)
+
+        recorder._audio_callback(chunk, len(chunk), {}, None)
+        recorder._audio_callback(chunk, len(chunk), {}, None)
+
+        result = recorder.get_buffer()
+        assert len(result) == 2 * len(chunk)
+        assert result.dtype == np.float32
+
+    def test_get_buffer_returns_view_without_copy(self):
+        """Test that the recorded samples are handed over without an extra copy."""
+        recorder = AudioRecorder()
+        buffer = recorder._buffer
+        recorder._audio_callback(np.array([0.1, 0.2], dtype=np.float32), 2, {}, None)
+
+        result = recorder.get_buffer()
+
+        assert np.shares_memory(result, buffer)
+        assert recorder._buffer is not buffer
+
+    def test_get_buffer_not_overwritten_by_next_recording(self):
+        """Test that the returned audio is not overwritten by the next recording."""
+        recorder = AudioRecorder()
+        recorder._audio_callback(np.array([0.1, 0.2], dtype=np.float32), 2, {}, None)
+        first = recorder.get_buffer()
+
+        recorder._audio_callback(np.array([0.9, 0.9], dtype=np.float32), 2, {}, None)
+
+        np.testing.assert_allclose(first, [0.1, 0.2], rtol=1e-6)
 
     def test_custom_parameters(self):
         """Test creating recorder with custom parameters."""
@@ -106,7 +184,7 @@ class TestAudioRecorder:
         recorder.shutdown()
 
         assert recorder.is_recording() is False
-        assert recorder._stop_recorder.is_set()
+        mock_stream.close.assert_called_once()
 
     @patch("whisper_dictate.audio.sd.InputStream")
     def test_stop_with_stream_error(self, mock_stream_class):
@@ -118,10 +196,30 @@ class TestAudioRecorder:
         recorder = AudioRecorder()
         recorder.start()
         recorder.stop()  # Should not raise
+        recorder._wait_for_teardown()
 
         assert recorder.is_recording() is False
 
 
+class TestSilenceDetection:
+    """Test the silent-recording check."""
+
+    def test_quiet_buffer_is_silent(self):
+        """Test that low-level noise below the threshold counts as silence."""
+        assert audio.is_silent(np.full(1600, -5e-4, dtype=np.float32)) is True
+
+    def test_empty_buffer_is_silent(self):
+        """Test that an empty buffer counts as silence."""
+        assert audio.is_silent(np.empty(0, dtype=np.float32)) is True
+
+    def test_negative_peak_is_not_silent(self):
+        """Test that a loud negative sample is detected as sound."""
+        samples = np.zeros(1600, dtype=np.float32)
+        samples[10] = -0.2
+
+        assert audio.is_silent(samples) is False
+
+
 class TestBackwardCompatibility:
     """Test backward compatibility functions."""
 
@@ -160,6 +258,7 @@ class TestBackwardCompatibility:
 
         audio.start_recording()
         audio.stop_recording()
+        audio.get_default_recorder()._wait_for_teardown()
 
         assert audio.is_recording() is False
         mock_stream.stop.assert_called_once()
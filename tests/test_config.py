@@ -3,6 +3,7 @@
 import os
 from unittest.mock import MagicMock, patch
 
+import whisper_dictate.config as config
 from whisper_dictate.config import (
     DEFAULT_AUTO_LOAD_MODEL,
     DEFAULT_AUTO_REGISTER_HOTKEY,
@@ -16,6 +17,8 @@ from whisper_dictate.config import (
     DEFAULT_MODEL,
     DEVICE_COMPUTE_DEFAULTS,
     MODEL_INFO,
+    default_compute_type,
+    get_default_compute,
     get_model_choices,
     get_model_display_name,
     normalize_compute_type,
@@ -37,19 +40,89 @@ class TestConfig:
         assert DEFAULT_LLM_KEY is not None
         assert DEFAULT_LLM_TEMP is not None
 
-    def test_normalize_compute_type_cpu(self):
+    @patch("whisper_dictate.config._supported_compute_types", return_value=None)
+    def test_normalize_compute_type_cpu(self, _mock_supported):
         """Test compute type normalization for CPU."""
         assert normalize_compute_type("cpu", "float16") == "int8"
         assert normalize_compute_type("cpu", "int8") == "int8"
         assert normalize_compute_type("cpu", "float32") == "float32"
+        assert normalize_compute_type("cpu", "int8_float16") == "int8"
+        assert normalize_compute_type("cpu", "bfloat16") == "int8"
 
-    def test_normalize_compute_type_cuda(self):
+    @patch("whisper_dictate.config._supported_compute_types", return_value=None)
+    def test_normalize_compute_type_cuda(self, _mock_supported):
         """Test compute type normalization for CUDA."""
-        assert normalize_compute_type("cuda", "int8") == "float16"
-        assert normalize_compute_type("cuda", "int8_float32") == "float16"
+        assert normalize_compute_type("cuda", "int8") == "int8_float16"
+        assert normalize_compute_type("cuda", "int8_float32") == "int8_float16"
         assert normalize_compute_type("cuda", "float32") == "float16"
         assert normalize_compute_type("cuda", "float16") == "float16"
         assert normalize_compute_type("cuda", "int8_float16") == "int8_float16"
+        assert normalize_compute_type("cuda", "int8_bfloat16") == "int8_bfloat16"
+
+    def test_normalize_compute_type_bfloat16_by_gpu_generation(self):
+        """Test that bfloat16 is kept on Ampere+ GPUs and mapped to float16 on older ones."""
+        ct2 = MagicMock()
+        with patch.dict("sys.modules", {"ctranslate2": ct2}):
+            ct2.get_supported_compute_types.return_value = {
+                "float16",
+                "bfloat16",
+                "int8_float16",
+                "int8_bfloat16",
+            }
+            assert normalize_compute_type("cuda", "bfloat16") == "bfloat16"
+            assert normalize_compute_type("cuda", "int8_bfloat16") == "int8_bfloat16"
+
+            config._supported_compute_types.cache_clear()
+            ct2.get_supported_compute_types.return_value = {"float16", "int8_float16"}
+            assert normalize_compute_type("cuda", "bfloat16") == "float16"
+            assert normalize_compute_type("cuda", "int8_bfloat16") == "int8_float16"
+
+    def test_normalize_compute_type_falls_back_to_fastest_supported(self):
+        """Test that a type the device cannot run is replaced by its fastest supported one."""
+        ct2 = MagicMock()
+        ct2.get_supported_compute_types.return_value = {"float16", "float32"}
+        with patch.dict("sys.modules", {"ctranslate2": ct2}):
+            assert normalize_compute_type("cuda", "int8") == "float16"
+            assert normalize_compute_type("cuda", "int8_float16") == "float16"
+            assert normalize_compute_type("cuda", "auto") == "auto"
+        ct2.get_supported_compute_types.assert_called_once_with("cuda")
+
+    @patch("whisper_dictate.config._supported_compute_types", return_value=None)
+    def test_normalize_compute_type_auto_passthrough(self, _mock_supported):
+        """Test that "auto" is left for CTranslate2 to resolve."""
+        assert normalize_compute_type("cpu", "auto") == "auto"
+        assert normalize_compute_type("cuda", "auto") == "auto"
+
+    def test_default_compute_type_prefers_fastest_supported(self):
+        """Test that the fastest supported type is chosen per device."""
+        ct2 = MagicMock()
+        ct2.get_supported_compute_types.return_value = {"int8", "int8_float32", "float32"}
+        with patch.dict("sys.modules", {"ctranslate2": ct2}):
+            assert default_compute_type("cpu") == "int8_float32"
+
+    def test_default_compute_type_falls_back_when_device_unavailable(self):
+        """Test that the static defaults are used when the device cannot be queried."""
+        ct2 = MagicMock()
+        ct2.get_supported_compute_types.side_effect = RuntimeError("no CUDA driver")
+        with patch.dict("sys.modules", {"ctranslate2": ct2}):
+            assert default_compute_type("cuda") == DEVICE_COMPUTE_DEFAULTS["cuda"]
+
+    def test_get_default_compute_uses_model_recommendation_on_cuda(self):
+        """Test that large models get mixed int8_float16 and small ones float16 on GPU."""
+        ct2 = MagicMock()
+        ct2.get_supported_compute_types.return_value = {"int8_float16", "float16", "float32"}
+        with patch.dict("sys.modules", {"ctranslate2": ct2}):
+            assert get_default_compute("cuda", "large-v3") == "int8_float16"
+            assert get_default_compute("cuda", "small") == "float16"
+
+    def test_get_default_compute_falls_back_when_recommendation_unsupported(self):
+        """Test that unsupported recommendations and CPU use the device default."""
+        ct2 = MagicMock()
+        ct2.get_supported_compute_types.return_value = {"float16", "float32"}
+        with patch.dict("sys.modules", {"ctranslate2": ct2}):
+            assert get_default_compute("cuda", "large-v3") == "float16"
+            assert get_default_compute("cpu", "large-v3") == "float32"
+            assert get_default_compute("cuda", "unknown-model") == "float16"
 
     def test_auto_startup_defaults(self):
         """Test that auto-startup defaults are defined and False by default."""
@@ -93,8 +166,7 @@ class TestSetCudaPaths:
             assert str(cublas_bin) in os.environ["CUDA_PATH"]
             assert str(cudnn_bin) in os.environ["CUDA_PATH"]
 
-            assert "CUDA_PATH_V12_4" in os.environ
-            assert str(cuda_runtime_bin) in os.environ["CUDA_PATH_V12_4"]
+            assert "CUDA_PATH_V12_4" not in os.environ
 
             assert "PATH" in os.environ
             assert str(cuda_runtime_bin) in os.environ["PATH"]
@@ -198,6 +270,62 @@ class TestSetCudaPaths:
             # Restore PATH
             os.environ["PATH"] = original_path
 
+    def test_set_cuda_paths_is_idempotent(self, tmp_path, monkeypatch):
+        """Calling set_cuda_paths twice should not duplicate environment entries."""
+        mock_sys = MagicMock()
+        mock_sys.frozen = True
+        mock_sys._MEIPASS = str(tmp_path)
+        cuda_runtime_bin = tmp_path / "nvidia" / "cuda_runtime" / "bin"
+        cuda_runtime_bin.mkdir(parents=True)
+        monkeypatch.delenv("CUDA_PATH", raising=False)
+        monkeypatch.setenv("PATH", os.environ.get("PATH", ""))
+
+        with patch("whisper_dictate.config.sys", mock_sys):
+            set_cuda_paths()
+            set_cuda_paths()
+
+        assert os.environ["CUDA_PATH"] == str(cuda_runtime_bin)
+        assert os.environ["PATH"].split(os.pathsep).count(str(cuda_runtime_bin)) == 1
+
+    def test_set_cuda_paths_drops_empty_path_entries(self, tmp_path, monkeypatch):
+        """Stray separators in existing values should not leave empty entries behind."""
+        mock_sys = MagicMock()
+        mock_sys.frozen = True
+        mock_sys._MEIPASS = str(tmp_path)
+        cuda_runtime_bin = tmp_path / "nvidia" / "cuda_runtime" / "bin"
+        cuda_runtime_bin.mkdir(parents=True)
+        monkeypatch.setenv("CUDA_PATH", f"{os.pathsep}existing{os.pathsep}")
+        monkeypatch.setenv("PATH", os.environ.get("PATH", ""))
+
+        with patch("whisper_dictate.config.sys", mock_sys):
+            set_cuda_paths()
+
+        assert os.environ["CUDA_PATH"] == os.pathsep.join([str(cuda_runtime_bin), "existing"])
+
+    def test_set_cuda_paths_registers_dll_directories(self, tmp_path, monkeypatch):
+        """On Windows each CUDA folder is registered once with os.add_dll_directory."""
+        mock_sys = MagicMock()
+        mock_sys.frozen = True
+        mock_sys._MEIPASS = str(tmp_path)
+        cuda_runtime_bin = tmp_path / "nvidia" / "cuda_runtime" / "bin"
+        cuda_runtime_bin.mkdir(parents=True)
+        monkeypatch.setenv("PATH", os.environ.get("PATH", ""))
+        monkeypatch.delenv("CUDA_PATH", raising=False)
+        monkeypatch.delenv("CUDA_PATH_V12_4", raising=False)
+
+        registered = []
+        monkeypatch.setattr(
+            os, "add_dll_directory", lambda path: registered.append(path), raising=False
+        )
+        monkeypatch.setattr(config, "_DLL_DIRECTORY_HANDLES", {})
+
+        with patch("whisper_dictate.config.sys", mock_sys):
+            set_cuda_paths()
+            set_cuda_paths()
+
+        assert registered == [str(cuda_runtime_bin)]
+        assert str(cuda_runtime_bin) in config._DLL_DIRECTORY_HANDLES
+
 
 class TestModelInfo:
     """Tests for MODEL_INFO and related functions."""
@@ -241,6 +369,11 @@ class TestModelInfo:
             assert model_id in MODEL_INFO
             assert display != model_id  # Should be formatted
 
+    def test_get_model_choices_is_built_once_per_device(self):
+        """Repeated dropdown refreshes should reuse the same immutable choices."""
+        assert get_model_choices("cpu") is get_model_choices("cpu")
+        assert get_model_choices("cpu") != get_model_choices("cuda")
+
     def test_device_compute_defaults(self):
         """DEVICE_COMPUTE_DEFAULTS should have entries for cpu and cuda."""
         assert "cpu" in DEVICE_COMPUTE_DEFAULTS
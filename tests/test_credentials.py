@@ -1,5 +1,7 @@
 """Tests for secure credential storage."""
 
+import subprocess
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -206,3 +208,9 @@ class TestIsCredentialStored:
         result = credentials.is_credential_stored("test_key")
 
         assert result is False
+
+
+def test_import_defers_keyring():
+    """Importing the module must not pay for keyring until a credential is used."""
+    code = "import sys, whisper_dictate.credentials; sys.exit('keyring' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
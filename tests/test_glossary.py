@@ -1,10 +1,13 @@
 """Tests for glossary management and application."""
 
+import logging
+import re
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+import whisper_dictate.glossary as glossary_module
 from whisper_dictate.glossary import (
     GlossaryManager,
     GlossaryRule,
@@ -41,6 +44,15 @@ class TestGlossaryPersistence:
         assert [r.trigger for r in manager.rules] == ["Alpha", "Beta"]
         assert [r.replacement for r in manager.rules] == ["first", "second"]
 
+    def test_legacy_text_skips_comments_and_prefers_arrow(self, tmp_path: Path) -> None:
+        glossary_file = tmp_path / "whisper_dictate_glossary.json"
+        glossary_file.write_text(
+            "  # note => ignored\na = b => c\r\nnothing here\n=> orphan\n", encoding="utf-8"
+        )
+        with patch("whisper_dictate.glossary.GLOSSARY_FILE", glossary_file):
+            manager = load_glossary_manager()
+        assert [(r.trigger, r.replacement) for r in manager.rules] == [("a = b", "c")]
+
     def test_write_saved_glossary_serializes_to_json(self, tmp_path: Path) -> None:
         glossary_file = tmp_path / "glossary.json"
         with patch("whisper_dictate.glossary.GLOSSARY_FILE", glossary_file):
@@ -49,6 +61,75 @@ class TestGlossaryPersistence:
         assert '"trigger": "team ai"' in content
         assert '"replacement": "TeamAI"' in content
 
+    def test_load_reuses_manager_while_file_is_unchanged(self, tmp_path: Path) -> None:
+        glossary_file = tmp_path / "glossary.json"
+        glossary_file.write_text("Alpha => first", encoding="utf-8")
+
+        first = GlossaryManager.load(glossary_file)
+        with patch.object(Path, "read_text", side_effect=AssertionError("re-read")):
+            second = GlossaryManager.load(glossary_file)
+
+        assert second is first
+
+    def test_load_rereads_after_file_changes(self, tmp_path: Path) -> None:
+        glossary_file = tmp_path / "glossary.json"
+        glossary_file.write_text("Alpha => first", encoding="utf-8")
+        GlossaryManager.load(glossary_file)
+
+        glossary_file.write_text("Alpha => first\nBeta => second", encoding="utf-8")
+
+        assert [r.trigger for r in GlossaryManager.load(glossary_file).rules] == ["Alpha", "Beta"]
+
+    def test_save_primes_load_cache(self, tmp_path: Path) -> None:
+        glossary_file = tmp_path / "glossary.json"
+        manager = GlossaryManager([GlossaryRule(trigger="team ai", replacement="TeamAI")])
+
+        assert manager.save(glossary_file) is True
+
+        assert GlossaryManager.load(glossary_file) is manager
+
+    def test_save_replaces_file_atomically(self, tmp_path: Path) -> None:
+        glossary_file = tmp_path / "glossary.json"
+        glossary_file.write_text("old => content", encoding="utf-8")
+        manager = GlossaryManager([GlossaryRule(trigger="team ai", replacement="TeamAI")])
+
+        assert manager.save(glossary_file, fsync=True) is True
+
+        assert '"trigger": "team ai"' in glossary_file.read_text(encoding="utf-8")
+        assert [p.name for p in tmp_path.iterdir()] == ["glossary.json"]
+
+    def test_failed_save_keeps_previous_file(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        glossary_file = tmp_path / "glossary.json"
+        glossary_file.write_text("old => content", encoding="utf-8")
+        manager = GlossaryManager([GlossaryRule(trigger="team ai", replacement="TeamAI")])
+
+        with (
+            patch("whisper_dictate.glossary.os.replace", side_effect=OSError("disk full")),
+            caplog.at_level(logging.WARNING, logger="whisper_dictate.glossary"),
+        ):
+            assert manager.save(glossary_file) is False
+
+        assert "Could not save glossary: disk full" in caplog.text
+
+        assert glossary_file.read_text(encoding="utf-8") == "old => content"
+        assert [p.name for p in tmp_path.iterdir()] == ["glossary.json"]
+
+    def test_stdlib_fallback_matches_orjson(self, tmp_path: Path, monkeypatch) -> None:
+        manager = GlossaryManager(
+            [GlossaryRule(trigger="smiley", replacement="🙂", description="emoji")]
+        )
+        glossary_file = tmp_path / "glossary.json"
+        assert manager.save(glossary_file) is True
+        orjson_bytes = glossary_file.read_bytes()
+
+        monkeypatch.setattr(glossary_module, "orjson", None)
+        assert manager.save(glossary_file) is True
+
+        assert glossary_file.read_bytes() == orjson_bytes
+        assert "🙂".encode() in orjson_bytes
+
 
 class TestGlossaryApplication:
     """Test matching behavior and priority."""
@@ -80,6 +161,105 @@ class TestGlossaryApplication:
         result = apply_glossary(text, manager)
         assert result.count("GPT-X") == 2
 
+    def test_apply_glossary_skips_empty_manager(self) -> None:
+        manager = GlossaryManager()
+        with patch.object(GlossaryManager, "apply", side_effect=AssertionError):
+            assert apply_glossary("hello", manager) == "hello"
+            assert apply_glossary("hello", None) == "hello"
+
+    def test_literal_rules_mix_case_sensitivity_in_one_pass(self) -> None:
+        manager = GlossaryManager(
+            [
+                GlossaryRule(trigger="Go", replacement="Golang", case_sensitive=True),
+                GlossaryRule(trigger="team ai", replacement="TeamAI"),
+            ]
+        )
+
+        result = manager.apply("Go tell TEAM AI to go home")
+
+        assert result == "Golang tell TeamAI to go home"
+
+    def test_leftmost_match_wins_over_longer_trigger(self) -> None:
+        manager = GlossaryManager(
+            [
+                GlossaryRule(trigger="a b c", replacement="X"),
+                GlossaryRule(trigger="x a", replacement="Y"),
+            ]
+        )
+
+        assert manager.rules[0].trigger == "a b c"
+        assert manager.apply("x a b c") == "Y b c"
+        assert manager.apply("a b c") == "X"
+
+    def test_literal_replacements_are_not_templates(self) -> None:
+        manager = GlossaryManager([GlossaryRule(trigger="home dir", replacement=r"C:\Users")])
+
+        assert manager.apply("open home dir") == r"open C:\Users"
+
+    def test_removed_rules_no_longer_apply(self) -> None:
+        manager = GlossaryManager([GlossaryRule(trigger="alpha", replacement="first")])
+        assert manager.apply("alpha") == "first"
+
+        manager.remove_rule("alpha")
+
+        assert manager.apply("alpha") == "alpha"
+
+    def test_regex_rules_with_groups_keep_backreferences(self) -> None:
+        manager = GlossaryManager(
+            [
+                GlossaryRule(
+                    trigger=r"(\w+) at example dot com",
+                    replacement=r"\1@example.com",
+                    match_type="regex",
+                ),
+                GlossaryRule(trigger="team ai", replacement="TeamAI"),
+            ]
+        )
+
+        assert manager.apply("mail dan at example dot com re team ai") == (
+            "mail dan@example.com re TeamAI"
+        )
+
+    def test_regex_rules_with_global_flags_still_apply(self) -> None:
+        manager = GlossaryManager(
+            [
+                GlossaryRule(
+                    trigger="(?s)foo.bar",
+                    replacement="FOOBAR",
+                    match_type="regex",
+                    case_sensitive=True,
+                ),
+                GlossaryRule(trigger="team ai", replacement="TeamAI"),
+            ]
+        )
+
+        assert manager.apply("foo\nbar and team ai") == "FOOBAR and TeamAI"
+
+    def test_text_without_trigger_characters_skips_the_scan(self) -> None:
+        manager = GlossaryManager([GlossaryRule(trigger="zulu", replacement="Zulu")])
+        manager.apply("warm up")  # Builds the combined pattern
+
+        with patch.object(manager, "_combined_pattern") as pattern:
+            assert manager.apply("nothing to see here") == "nothing to see here"
+
+        pattern.sub.assert_not_called()
+
+    def test_prefilter_ignores_case(self) -> None:
+        manager = GlossaryManager([GlossaryRule(trigger="zulu", replacement="Zulu")])
+
+        assert manager.apply("ZULU time") == "Zulu time"
+
+    def test_prefilter_keeps_non_ascii_case_folds(self) -> None:
+        dotless = GlossaryManager(
+            [GlossaryRule(trigger="ıstanbul", replacement="<X>", word_boundary=False)]
+        )
+        dotted = GlossaryManager(
+            [GlossaryRule(trigger="istanbul", replacement="<X>", word_boundary=False)]
+        )
+
+        assert dotless.apply("Istanbul") == "<X>"
+        assert dotted.apply("ıstanbul") == "<X>"
+
 
 class TestGlossaryRuleManipulation:
     """Test adding, updating, and removing rules."""
@@ -150,6 +330,20 @@ class TestGlossaryRuleManipulation:
 
         assert len(manager.rules) == 1
 
+    def test_remove_rule_drops_duplicate_triggers(self) -> None:
+        """Test that every rule sharing the trigger is removed, not just one."""
+        manager = GlossaryManager(
+            [
+                GlossaryRule(trigger="alpha", replacement="first"),
+                GlossaryRule(trigger="ALPHA", replacement="second"),
+            ]
+        )
+
+        manager.remove_rule("Alpha")
+
+        assert manager.rules == []
+        assert manager.apply("alpha") == "alpha"
+
 
 class TestGlossaryCSV:
     """Test CSV import and export functionality."""
@@ -254,6 +448,26 @@ alpha,new_value,word"""
         assert manager.rules[0].replacement == "new_value"
         assert manager.rules[0].match_type == "word"
 
+    def test_import_csv_accepts_common_boolean_spellings(self) -> None:
+        """Test that yes/no and 1/0 work for the boolean columns."""
+        manager = GlossaryManager()
+
+        manager.import_csv(
+            "trigger,replacement,case_sensitive,word_boundary\nalpha,one, Yes ,0\nbeta,two,maybe,\n"
+        )
+
+        flags = {r.trigger: (r.case_sensitive, r.word_boundary) for r in manager.rules}
+        assert flags == {"alpha": (True, False), "beta": (False, True)}
+
+    def test_import_csv_repeated_trigger_keeps_last_row(self) -> None:
+        """Test that a trigger repeated within one import resolves to the last row."""
+        manager = GlossaryManager()
+
+        manager.import_csv("trigger,replacement\nalpha,one\nbeta gamma,two\nAlpha,three")
+
+        assert [r.trigger for r in manager.rules] == ["beta gamma", "Alpha"]
+        assert manager.apply("alpha") == "three"
+
     def test_import_csv_round_trip(self) -> None:
         """Test that export/import cycle preserves rules."""
         original_rules = [
@@ -392,26 +606,63 @@ class TestGlossaryRuleSorting:
         # Both are single-word, so sort by character length
         assert len(manager.rules[0].trigger) >= len(manager.rules[1].trigger)
 
-    def test_sorting_clears_compiled_patterns(self) -> None:
-        """Test that sorting clears cached regex patterns."""
+    def test_sorting_keeps_compiled_patterns(self) -> None:
+        """Test that re-sorting does not discard patterns of unchanged rules."""
         rule = GlossaryRule(trigger="test", replacement="TEST")
         manager = GlossaryManager([rule])
-
-        # Compile the pattern
-        manager.rules[0].compile_pattern()
-        assert manager.rules[0]._compiled is not None
+        compiled = rule.compile_pattern()
 
         # Add another rule (triggers re-sort)
         manager.upsert_rule(GlossaryRule(trigger="another", replacement="ANOTHER"))
 
-        # All patterns should be cleared
-        for r in manager.rules:
-            assert r._compiled is None
+        assert rule.compile_pattern() is compiled
+
+    def test_sort_key_follows_trigger_edits(self) -> None:
+        """Test that the cached priority key is recomputed when the trigger changes."""
+        rule = GlossaryRule(trigger="test", replacement="TEST")
+        assert rule.sort_key() == (-1, -4)
+
+        rule.trigger = "two  words"
+
+        assert rule.sort_key() == (-2, -10)
+
+    def test_warm_up_compiles_patterns_before_apply(self) -> None:
+        """Test that warm_up() builds the combined and per-rule patterns."""
+        grouped = GlossaryRule(trigger=r"(\d+)k", replacement=r"\1000", match_type="regex")
+        broken = GlossaryRule(trigger="(", replacement="x", match_type="regex")
+        manager = GlossaryManager(
+            [GlossaryRule(trigger="ml", replacement="machine learning"), grouped, broken]
+        )
+
+        manager.warm_up()
+
+        assert manager._combined_pattern is not None
+        assert grouped._compiled is not None
+        assert broken._compiled is None
+
+    def test_changing_rule_recompiles_pattern(self) -> None:
+        """Test that editing a rule's trigger or flags invalidates its cached pattern."""
+        rule = GlossaryRule(trigger="test", replacement="TEST")
+        compiled = rule.compile_pattern()
+
+        rule.case_sensitive = True
+
+        assert rule.compile_pattern() is not compiled
+        assert rule.compile_pattern().flags & re.IGNORECASE == 0
 
 
 class TestGlossaryRuleSerialization:
     """Test rule serialization and deserialization."""
 
+    def test_rules_share_interned_strings(self) -> None:
+        """Test that equal replacements from separate sources are one object."""
+        first = GlossaryRule.from_dict(
+            {"trigger": "ml", "replacement": "".join(["Machine", "Learning"])}
+        )
+        second = GlossaryRule(trigger="m.l.", replacement="".join(["Machine", "Learning"]))
+
+        assert first.replacement is second.replacement
+
     def test_rule_to_dict(self) -> None:
         """Test converting rule to dictionary."""
         rule = GlossaryRule(
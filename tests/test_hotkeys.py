@@ -38,6 +38,16 @@ class TestHotkeyParsing:
         with pytest.raises(ValueError, match="Only single A..Z keys supported"):
             parse_hotkey_string("CTRL+1")
 
+    def test_parse_non_ascii_letter_rejected(self):
+        """Test that letters outside A..Z raise ValueError rather than KeyError."""
+        with pytest.raises(ValueError, match="Only single A..Z keys supported"):
+            parse_hotkey_string("CTRL+É")
+
+    def test_vk_table_is_read_only(self):
+        """Test that the virtual key table cannot be mutated."""
+        with pytest.raises(TypeError):
+            hotkeys.VK["A"] = 0
+
     def test_parse_case_insensitive(self):
         """Test that parsing is case insensitive."""
         mods1, vk1 = parse_hotkey_string("ctrl+win+g")
@@ -83,12 +93,37 @@ class TestHotkeyManager:
         failing_user32 = SimpleNamespace(
             RegisterHotKey=lambda *_args, **_kwargs: 0,
             UnregisterHotKey=lambda *_args, **_kwargs: None,
-            GetMessageW=lambda *_args, **_kwargs: 0,
-            TranslateMessage=lambda *_args, **_kwargs: None,
-            DispatchMessageW=lambda *_args, **_kwargs: None,
+            MsgWaitForMultipleObjectsEx=lambda *_args, **_kwargs: 0,
+            PeekMessageW=lambda *_args, **_kwargs: 0,
         )
 
         monkeypatch.setattr(hotkeys, "user32", failing_user32)
 
         with pytest.raises(HotkeyError, match="Failed to register hotkey"):
             manager.register("CTRL+G")
+
+    def test_message_pump_dispatches_hotkey_until_quit(self, monkeypatch):
+        """Ensure queued WM_HOTKEY messages fire the callback and WM_QUIT ends the pump."""
+        calls = []
+        manager = HotkeyManager(lambda: calls.append("hotkey"))
+        manager._running = True
+        queued = [(hotkeys.WM_HOTKEY, hotkeys.TOGGLE_ID), (hotkeys.WM_QUIT, 0)]
+
+        def peek(msg_ref, *_args):
+            if not queued:
+                return 0
+            msg = msg_ref._obj
+            msg.message, msg.wParam = queued.pop(0)
+            return 1
+
+        fake_user32 = SimpleNamespace(
+            RegisterHotKey=lambda *_args: 1,
+            UnregisterHotKey=lambda *_args: calls.append("unregister"),
+            MsgWaitForMultipleObjectsEx=lambda *_args: 0,
+            PeekMessageW=peek,
+        )
+        monkeypatch.setattr(hotkeys, "user32", fake_user32)
+
+        manager._message_pump()
+
+        assert calls == ["hotkey", "unregister"]
@@ -0,0 +1,56 @@
+"""Tests for keyboard_input.py - SendInput-based paste shortcut."""
+
+import ctypes
+from unittest.mock import MagicMock
+
+from whisper_dictate import keyboard_input
+
+
+class TestInputLayout:
+    """Tests for the Win32 INPUT structure layout."""
+
+    def test_input_size_matches_win32(self):
+        """INPUT must match the native size or SendInput rejects the batch."""
+        expected = 40 if ctypes.sizeof(ctypes.c_void_p) == 8 else 28
+        assert ctypes.sizeof(keyboard_input.INPUT) == expected
+
+    def test_paste_sequence(self):
+        """The paste batch presses Ctrl, taps V, then releases Ctrl."""
+        events = [(e.type, e.ki.wVk, e.ki.dwFlags) for e in keyboard_input._PASTE_INPUTS]
+
+        keyup = keyboard_input.KEYEVENTF_KEYUP
+        assert events == [
+            (keyboard_input.INPUT_KEYBOARD, keyboard_input.VK_CONTROL, 0),
+            (keyboard_input.INPUT_KEYBOARD, keyboard_input.VK_V, 0),
+            (keyboard_input.INPUT_KEYBOARD, keyboard_input.VK_V, keyup),
+            (keyboard_input.INPUT_KEYBOARD, keyboard_input.VK_CONTROL, keyup),
+        ]
+
+
+class TestSendPaste:
+    """Tests for send_paste()."""
+
+    def test_send_paste_without_user32(self, monkeypatch):
+        """Non-Windows platforms report that nothing was sent."""
+        monkeypatch.setattr(keyboard_input, "USER32", None)
+
+        assert keyboard_input.send_paste() is False
+
+    def test_send_paste_single_call(self, monkeypatch):
+        """All four key events go out in one SendInput call."""
+        user32 = MagicMock()
+        user32.SendInput.return_value = 4
+        monkeypatch.setattr(keyboard_input, "USER32", user32)
+
+        assert keyboard_input.send_paste() is True
+        user32.SendInput.assert_called_once_with(
+            4, keyboard_input._PASTE_INPUTS, ctypes.sizeof(keyboard_input.INPUT)
+        )
+
+    def test_send_paste_blocked(self, monkeypatch):
+        """A partially injected batch (e.g. blocked by UIPI) is reported as failure."""
+        user32 = MagicMock()
+        user32.SendInput.return_value = 0
+        monkeypatch.setattr(keyboard_input, "USER32", user32)
+
+        assert keyboard_input.send_paste() is False
@@ -1,11 +1,36 @@
 """Tests for LLM cleanup functionality."""
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from whisper_dictate.glossary import GlossaryManager, GlossaryRule
-from whisper_dictate.llm_cleanup import LLMCleanupError, clean_with_llm
+from whisper_dictate.llm_cleanup import LLMCleanupError, clean_with_llm, needs_llm_cleanup
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("um", False),
+        ("Okay.", False),
+        ("  thanks a lot  ", False),  # Three words but under 20 characters
+        ("Yes no ok", False),
+        ("supercalifragilisticexpialidocious", False),  # Long but a single word
+        ("please schedule the meeting for tomorrow", True),
+    ],
+)
+def test_needs_llm_cleanup(text, expected):
+    """Trivial dictations skip the LLM round-trip."""
+    assert needs_llm_cleanup(text) is expected
+
+
+def test_needs_llm_cleanup_thresholds_are_configurable():
+    """Zero thresholds always clean; custom thresholds override the defaults."""
+    assert needs_llm_cleanup("um", min_chars=0, min_words=0) is True
+    assert needs_llm_cleanup("thanks a lot", min_chars=8, min_words=3) is True
+    assert needs_llm_cleanup("thanks a lot", min_chars=8, min_words=4) is False
 
 
 class TestLLMCleanup:
@@ -58,6 +83,40 @@ class TestLLMCleanup:
             assert result == "Cleaned text"
             mock_client.chat.completions.create.assert_called_once()
 
+    def test_clean_with_llm_reuses_client(self):
+        """Test that repeated cleanups against one endpoint share a client."""
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = lambda **kwargs: iter([])
+
+        with patch("whisper_dictate.llm_cleanup.OpenAI", return_value=mock_client) as mock_openai:
+            clean_with_llm("one", "http://test", "model", "key", "prompt", 0.1)
+            clean_with_llm("two", "http://test", "model", "key", "prompt", 0.1)
+            clean_with_llm("three", "http://other", "model", "key", "prompt", 0.1)
+
+        assert mock_openai.call_count == 2
+        assert mock_client.chat.completions.create.call_count == 3
+
+    def test_clean_with_llm_reports_first_token_once(self):
+        """Test that the first-token callback fires once, when content first arrives."""
+        chunks = []
+        for content in (None, "Hello", " world"):
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            chunk.usage = None
+            chunks.append(chunk)
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = iter(chunks)
+        on_first_token = MagicMock()
+
+        with patch("whisper_dictate.llm_cleanup.OpenAI", return_value=mock_client):
+            result = clean_with_llm(
+                "raw", "http://test", "model", None, "prompt", 0.1, on_first_token=on_first_token
+            )
+
+        assert result == "Hello world"
+        on_first_token.assert_called_once_with()
+
     def test_clean_with_llm_no_openai(self):
         """Test that missing OpenAI raises error."""
         with patch("whisper_dictate.llm_cleanup.OpenAI", None):
@@ -144,3 +203,9 @@ class TestLLMCleanup:
         assert "Application-specific instructions" in system_prompt
         assert "App specific" in system_prompt
         assert system_prompt.endswith("Some context")
+
+
+def test_import_defers_openai():
+    """Importing the module must not import openai until a client is created."""
+    code = "import sys, whisper_dictate.llm_cleanup; sys.exit('openai' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
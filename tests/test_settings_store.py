@@ -1,11 +1,14 @@
 """Tests for settings_store.py - persistent settings storage."""
 
+import io
 import json
+import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from whisper_dictate import credentials, settings_store
 from whisper_dictate.settings_store import (
     SETTINGS_FILE,
     get_secure_setting,
@@ -14,22 +17,30 @@ from whisper_dictate.settings_store import (
 )
 
 
+@pytest.fixture
+def patched_settings_path(monkeypatch, fake_settings_path):
+    """Point SETTINGS_FILE at an in-memory path for the duration of a test."""
+    monkeypatch.setattr(settings_store, "SETTINGS_FILE", fake_settings_path)
+    return fake_settings_path
+
+
 class TestLoadSettings:
     """Tests for load_settings function."""
 
-    def test_load_settings_returns_default_when_file_missing(self, monkeypatch):
+    def test_load_settings_returns_default_when_file_missing(self, patched_settings_path):
         """Test that load_settings returns default dict when file doesn't exist."""
-        # Mock SETTINGS_FILE.is_file() to return False
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = False
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         result = load_settings()
 
         assert result == {"app_prompts": {}}
-        mock_path.is_file.assert_called_once()
+        assert len(patched_settings_path.read_calls) == 1
+
+    def test_load_settings_missing_file_is_not_logged_as_error(self, caplog, patched_settings_path):
+        """Test that a missing settings file is treated as a normal first run."""
+        load_settings()
+
+        assert "Could not read saved settings" not in caplog.text
 
-    def test_load_settings_success_with_valid_json(self, monkeypatch):
+    def test_load_settings_success_with_valid_json(self, patched_settings_path):
         """Test successful loading of valid JSON settings."""
         test_settings = {
             "model": "base",
@@ -37,25 +48,18 @@ class TestLoadSettings:
             "app_prompts": {"vscode": "Write code comments"},
         }
 
-        # Mock SETTINGS_FILE
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        mock_path.read_text.return_value = json.dumps(test_settings)
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
+        patched_settings_path.content = json.dumps(test_settings)
 
         result = load_settings()
 
         assert result == test_settings
-        mock_path.read_text.assert_called_once_with(encoding="utf-8")
+        assert len(patched_settings_path.read_calls) == 1
 
-    def test_load_settings_adds_app_prompts_key_if_missing(self, monkeypatch):
+    def test_load_settings_adds_app_prompts_key_if_missing(self, patched_settings_path):
         """Test that load_settings adds app_prompts key if not present in loaded settings."""
         test_settings = {"model": "base", "compute_type": "int8"}
 
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        mock_path.read_text.return_value = json.dumps(test_settings)
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
+        patched_settings_path.content = json.dumps(test_settings)
 
         result = load_settings()
 
@@ -64,12 +68,9 @@ class TestLoadSettings:
         assert result["model"] == "base"
         assert result["compute_type"] == "int8"
 
-    def test_load_settings_handles_invalid_json(self, monkeypatch, caplog):
+    def test_load_settings_handles_invalid_json(self, caplog, patched_settings_path):
         """Test that load_settings returns default dict when JSON is invalid."""
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        mock_path.read_text.return_value = "{invalid json content"
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
+        patched_settings_path.content = "{invalid json content"
 
         result = load_settings()
 
@@ -77,12 +78,10 @@ class TestLoadSettings:
         # Verify error was logged
         assert "Could not read saved settings:" in caplog.text
 
-    def test_load_settings_handles_io_error(self, monkeypatch, caplog):
+    def test_load_settings_handles_io_error(self, caplog, patched_settings_path):
         """Test that load_settings handles I/O errors gracefully."""
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        mock_path.read_text.side_effect = OSError("Permission denied")
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
+        patched_settings_path.content = ""
+        patched_settings_path.read_error = OSError("Permission denied")
 
         result = load_settings()
 
@@ -91,26 +90,30 @@ class TestLoadSettings:
         assert "Could not read saved settings:" in caplog.text
         assert "Permission denied" in caplog.text
 
-    def test_load_settings_handles_empty_file(self, monkeypatch, capsys):
+    def test_load_settings_handles_empty_file(self, patched_settings_path):
         """Test that load_settings handles empty file."""
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        mock_path.read_text.return_value = ""
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
+        patched_settings_path.content = ""
 
         result = load_settings()
 
         assert result == {"app_prompts": {}}
 
+    def test_load_settings_interns_app_prompt_keys(self, patched_settings_path):
+        """Test that app prompt process names are interned on load."""
+        patched_settings_path.content = json.dumps({"app_prompts": {"vscode": "Write code"}})
+
+        result = load_settings()
+
+        key = next(iter(result["app_prompts"]))
+        assert key is sys.intern("vscode")
+        assert result["app_prompts"][key] == "Write code"
+
     @patch("whisper_dictate.settings_store._migrate_secure_settings")
-    def test_load_settings_migrates_secure_settings(self, mock_migrate, monkeypatch):
+    def test_load_settings_migrates_secure_settings(self, mock_migrate, patched_settings_path):
         """Test that load_settings calls migration for secure settings."""
         test_settings = {"model": "base", "llm_key": "plaintext_key"}
 
-        mock_path = MagicMock(spec=Path)
-        mock_path.is_file.return_value = True
-        mock_path.read_text.return_value = json.dumps(test_settings)
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
+        patched_settings_path.content = json.dumps(test_settings)
 
         load_settings()
 
@@ -120,10 +123,32 @@ class TestLoadSettings:
         assert "model" in call_args
 
 
+class TestBinaryIO:
+    """Tests that settings IO bypasses text-mode encoding lookups."""
+
+    def test_load_and_save_do_not_use_text_mode(self, tmp_path, monkeypatch):
+        """Test that load/save never call io.text_encoding."""
+        monkeypatch.setattr(settings_store, "SETTINGS_FILE", tmp_path / "settings.json")
+        calls = []
+        original = io.text_encoding
+
+        def counting_text_encoding(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(io, "text_encoding", counting_text_encoding)
+
+        assert save_settings({"model": "base", "prompt": "Smiley 🙂"}) is True
+        result = load_settings()
+
+        assert result["prompt"] == "Smiley 🙂"
+        assert calls == []
+
+
 class TestSaveSettings:
     """Tests for save_settings function."""
 
-    def test_save_settings_success(self, monkeypatch):
+    def test_save_settings_success(self, patched_settings_path):
         """Test successful saving of settings."""
         test_settings = {
             "model": "base",
@@ -131,64 +156,56 @@ class TestSaveSettings:
             "app_prompts": {"vscode": "Write code"},
         }
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         result = save_settings(test_settings)
 
         assert result is True
-        mock_parent.mkdir.assert_called_once_with(parents=True, exist_ok=True)
-        mock_path.write_text.assert_called_once()
+        assert patched_settings_path.parent.mkdir_calls == [{"parents": True, "exist_ok": True}]
+        assert len(patched_settings_path.write_calls) == 1
 
         # Verify the JSON was properly formatted
-        call_args = mock_path.write_text.call_args
-        written_json = call_args[0][0]
+        written_json = patched_settings_path.written
+        assert isinstance(written_json, bytes)
         assert json.loads(written_json) == test_settings
-        assert call_args[1] == {"encoding": "utf-8"}
 
-    def test_save_settings_creates_parent_directory(self, monkeypatch):
+    def test_save_settings_creates_parent_directory(self, patched_settings_path):
         """Test that save_settings creates parent directory if it doesn't exist."""
         test_settings = {"model": "base"}
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         save_settings(test_settings)
 
         # Verify mkdir was called with correct parameters
-        mock_parent.mkdir.assert_called_once_with(parents=True, exist_ok=True)
+        assert patched_settings_path.parent.mkdir_calls == [{"parents": True, "exist_ok": True}]
 
-    def test_save_settings_formats_json_with_indent(self, monkeypatch):
+    def test_save_settings_formats_json_with_indent(self, patched_settings_path):
         """Test that save_settings formats JSON with 2-space indentation."""
         test_settings = {"model": "base", "nested": {"key": "value"}}
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         save_settings(test_settings)
 
         # Verify JSON formatting
-        call_args = mock_path.write_text.call_args
-        written_json = call_args[0][0]
-        expected_json = json.dumps(test_settings, indent=2)
-        assert written_json == expected_json
+        expected_json = json.dumps(test_settings, indent=2).encode("utf-8")
+        assert patched_settings_path.written == expected_json
+
+    def test_save_settings_stdlib_fallback_matches_orjson(self, monkeypatch, patched_settings_path):
+        """Test that the stdlib encoder produces the same bytes when orjson is missing."""
+        test_settings = {"model": "base", "prompt": "Smiley 🙂", "nested": {"key": [1, 2]}}
+
+        save_settings(test_settings)
+        orjson_bytes = patched_settings_path.written
+
+        monkeypatch.setattr(settings_store, "orjson", None)
+        patched_settings_path.content = None
+        save_settings(test_settings)
+
+        assert patched_settings_path.written == orjson_bytes
+        assert "🙂".encode() in orjson_bytes
 
     @patch("whisper_dictate.settings_store._store_secure_settings")
-    def test_save_settings_handles_write_error(self, mock_store, monkeypatch, caplog):
+    def test_save_settings_handles_write_error(self, mock_store, caplog, patched_settings_path):
         """Test that save_settings returns False on write error."""
         test_settings = {"model": "base"}
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        mock_path.write_text.side_effect = OSError("Permission denied")
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
+        patched_settings_path.write_error = OSError("Permission denied")
 
         result = save_settings(test_settings)
 
@@ -198,15 +215,11 @@ class TestSaveSettings:
         assert "Permission denied" in caplog.text
 
     @patch("whisper_dictate.settings_store._store_secure_settings")
-    def test_save_settings_handles_mkdir_error(self, mock_store, monkeypatch, caplog):
+    def test_save_settings_handles_mkdir_error(self, mock_store, caplog, patched_settings_path):
         """Test that save_settings returns False when directory creation fails."""
         test_settings = {"model": "base"}
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_parent.mkdir.side_effect = OSError("Cannot create directory")
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
+        patched_settings_path.parent.mkdir_error = OSError("Cannot create directory")
 
         result = save_settings(test_settings)
 
@@ -215,37 +228,25 @@ class TestSaveSettings:
         assert "Could not save settings:" in caplog.text
         assert "Cannot create directory" in caplog.text
 
-    def test_save_settings_with_empty_dict(self, monkeypatch):
+    def test_save_settings_with_empty_dict(self, patched_settings_path):
         """Test saving empty settings dictionary."""
         test_settings = {}
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         result = save_settings(test_settings)
 
         assert result is True
-        call_args = mock_path.write_text.call_args
-        written_json = call_args[0][0]
-        assert json.loads(written_json) == {}
+        assert json.loads(patched_settings_path.written) == {}
 
     @patch("whisper_dictate.settings_store._store_secure_settings")
-    def test_save_settings_stores_secure_settings(self, mock_store, monkeypatch):
+    def test_save_settings_stores_secure_settings(self, mock_store, patched_settings_path):
         """Test that save_settings calls secure storage for API keys."""
         test_settings = {"model": "base", "llm_key": "my_secret_key"}
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         save_settings(test_settings)
 
         mock_store.assert_called_once_with(test_settings)
 
-    def test_save_settings_excludes_secure_keys_from_json(self, monkeypatch):
+    def test_save_settings_excludes_secure_keys_from_json(self, patched_settings_path):
         """Test that API keys are not written to JSON file."""
         test_settings = {
             "model": "base",
@@ -253,38 +254,125 @@ class TestSaveSettings:
             "llm_endpoint": "http://localhost:1234",
         }
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         # Mock the credentials module to prevent actual keyring calls
         with patch("whisper_dictate.settings_store._store_secure_settings"):
             save_settings(test_settings)
 
         # Verify written JSON doesn't contain llm_key
-        call_args = mock_path.write_text.call_args
-        written_json = call_args[0][0]
-        saved_data = json.loads(written_json)
+        saved_data = json.loads(patched_settings_path.written)
 
         assert "llm_key" not in saved_data
         assert "model" in saved_data
         assert "llm_endpoint" in saved_data
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_default_settings_bytes_match_encoder(self, monkeypatch, use_orjson):
+        """Test that the precomputed default payload matches real encoder output."""
+        if not use_orjson:
+            monkeypatch.setattr(settings_store, "orjson", None)
+        monkeypatch.setattr(settings_store, "_DEFAULT_SETTINGS", None)
+
+        encoded = settings_store._encode_settings({"app_prompts": {}})
+
+        assert encoded == settings_store._DEFAULT_SETTINGS_BYTES
+
+    def test_save_settings_skips_write_when_unchanged(self, patched_settings_path):
+        """Test that save_settings does not rewrite identical content."""
+        test_settings = {"model": "base", "app_prompts": {}}
+
+        patched_settings_path.content = json.dumps(test_settings, indent=2)
+
+        result = save_settings(test_settings)
+
+        assert result is True
+        assert patched_settings_path.write_calls == []
+        assert patched_settings_path.parent.mkdir_calls == []
+
+    def test_save_settings_writes_when_changed(self, patched_settings_path):
+        """Test that save_settings writes when on-disk content differs."""
+        patched_settings_path.content = json.dumps({"model": "small"}, indent=2)
+
+        result = save_settings({"model": "base"})
+
+        assert result is True
+        assert json.loads(patched_settings_path.written) == {"model": "base"}
+
 
 class TestGetSecureSetting:
     """Tests for get_secure_setting function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_credential_cache(self):
+        settings_store._cached_retrieve.cache_clear()
+        yield
+        settings_store._cached_retrieve.cache_clear()
+
     @patch("whisper_dictate.settings_store.credentials.retrieve_credential")
     def test_get_secure_setting_success(self, mock_retrieve):
         """Test retrieving a secure setting."""
         mock_retrieve.return_value = "my_api_key"
 
         result = get_secure_setting("llm_key")
+        second = get_secure_setting("llm_key")
 
         assert result == "my_api_key"
+        assert second == "my_api_key"
+        mock_retrieve.assert_called_once_with("llm_api_key")
+
+    @patch("whisper_dictate.settings_store.credentials.store_credential")
+    @patch("whisper_dictate.settings_store.credentials.retrieve_credential")
+    def test_get_secure_setting_cache_invalidated_on_save(
+        self, mock_retrieve, mock_store, patched_settings_path
+    ):
+        """Test that saving a new secure value forces a fresh retrieval."""
+        mock_retrieve.return_value = "old_key"
+        assert get_secure_setting("llm_key") == "old_key"
+
+        save_settings({"llm_key": "new_key"})
+        mock_retrieve.return_value = "new_key"
+
+        assert get_secure_setting("llm_key") == "new_key"
+        assert mock_retrieve.call_count == 2
+
+    @patch("whisper_dictate.settings_store.credentials.store_credential")
+    @patch("whisper_dictate.settings_store.credentials.retrieve_credential")
+    def test_save_skips_unchanged_secure_value(
+        self, mock_retrieve, mock_store, patched_settings_path
+    ):
+        """Test that re-saving the stored API key does not rewrite the keyring."""
+        mock_retrieve.return_value = "same_key"
+
+        save_settings({"llm_key": "same_key"})
+        save_settings({"llm_key": "same_key"})
+
+        mock_store.assert_not_called()
         mock_retrieve.assert_called_once_with("llm_api_key")
 
+    @patch("whisper_dictate.settings_store.credentials.store_credential")
+    @patch("whisper_dictate.settings_store.credentials.retrieve_credential")
+    def test_save_stores_secure_value_when_lookup_fails(
+        self, mock_retrieve, mock_store, patched_settings_path
+    ):
+        """Test that a failed lookup still lets the new key be written."""
+        mock_retrieve.side_effect = credentials.CredentialStorageError("locked")
+
+        save_settings({"llm_key": "new_key"})
+
+        mock_store.assert_called_once_with("llm_api_key", "new_key")
+
+    @patch("whisper_dictate.settings_store.time.monotonic")
+    @patch("whisper_dictate.settings_store.credentials.retrieve_credential")
+    def test_get_secure_setting_cache_expires(self, mock_retrieve, mock_monotonic):
+        """Test that cached credentials are refreshed after the cache window."""
+        mock_retrieve.return_value = "my_api_key"
+        mock_monotonic.return_value = 100.0
+        get_secure_setting("llm_key")
+
+        mock_monotonic.return_value = 100.0 + settings_store.CREDENTIAL_CACHE_SECONDS
+        get_secure_setting("llm_key")
+
+        assert mock_retrieve.call_count == 2
+
     @patch("whisper_dictate.settings_store.credentials.retrieve_credential")
     def test_get_secure_setting_not_found(self, mock_retrieve):
         """Test retrieving non-existent secure setting returns None."""
@@ -325,7 +413,7 @@ class TestSettingsFileConstant:
 class TestAutoStartupSettings:
     """Tests for auto-startup settings."""
 
-    def test_save_settings_includes_auto_load_model(self, monkeypatch):
+    def test_save_settings_includes_auto_load_model(self, patched_settings_path):
         """Test that auto_load_model setting is saved."""
         test_settings = {
             "model": "base",
@@ -333,22 +421,15 @@ class TestAutoStartupSettings:
             "auto_register_hotkey": False,
         }
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         with patch("whisper_dictate.settings_store._store_secure_settings"):
             save_settings(test_settings)
 
-        call_args = mock_path.write_text.call_args
-        written_json = call_args[0][0]
-        saved_data = json.loads(written_json)
+        saved_data = json.loads(patched_settings_path.written)
 
         assert "auto_load_model" in saved_data
         assert saved_data["auto_load_model"] is True
 
-    def test_save_settings_includes_auto_register_hotkey(self, monkeypatch):
+    def test_save_settings_includes_auto_register_hotkey(self, patched_settings_path):
         """Test that auto_register_hotkey setting is saved."""
         test_settings = {
             "model": "base",
@@ -356,17 +437,10 @@ class TestAutoStartupSettings:
             "auto_register_hotkey": True,
         }
 
-        mock_path = MagicMock(spec=Path)
-        mock_parent = MagicMock()
-        mock_path.parent = mock_parent
-        monkeypatch.setattr("whisper_dictate.settings_store.SETTINGS_FILE", mock_path)
-
         with patch("whisper_dictate.settings_store._store_secure_settings"):
             save_settings(test_settings)
 
-        call_args = mock_path.write_text.call_args
-        written_json = call_args[0][0]
-        saved_data = json.loads(written_json)
+        saved_data = json.loads(patched_settings_path.written)
 
         assert "auto_register_hotkey" in saved_data
         assert saved_data["auto_register_hotkey"] is True
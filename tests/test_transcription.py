@@ -1,61 +1,139 @@
 """Tests for transcription functionality."""
 
+import subprocess
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from whisper_dictate.transcription import TranscriptionError, load_model, transcribe_audio
+from whisper_dictate import transcription
+from whisper_dictate.transcription import (
+    DEFAULT_TEMPERATURES,
+    DEFAULT_VAD_OPTIONS,
+    TranscriptionError,
+    clear_model_cache,
+    load_model,
+    resolved_compute_type,
+    transcribe_audio,
+    warm_up_model,
+)
 
 
 class TestTranscription:
     """Test transcription functionality."""
 
-    def test_transcribe_audio_success(self):
+    @pytest.fixture(autouse=True)
+    def _clear_model_cache(self):
+        clear_model_cache()
+        yield
+        clear_model_cache()
+
+    @pytest.fixture(autouse=True)
+    def _unknown_device_capabilities(self):
+        """Keep compute type normalization independent of the test machine's GPU."""
+        with patch("whisper_dictate.config._supported_compute_types", return_value=None):
+            yield
+
+    def test_transcribe_audio_success(self, whisper_model_stub):
         """Test successful transcription."""
-        mock_model = MagicMock()
         mock_segment = MagicMock()
         mock_segment.text = "Hello world"
-        mock_model.transcribe.return_value = ([mock_segment], {})
+        whisper_model_stub.transcribe.return_value = ([mock_segment], {})
 
         audio_data = b"fake audio data"
-        result = transcribe_audio(mock_model, audio_data)
+        result = transcribe_audio(whisper_model_stub, audio_data)
 
         assert result == "Hello world"
-        mock_model.transcribe.assert_called_once()
+        whisper_model_stub.transcribe.assert_called_once()
 
-    def test_transcribe_audio_multiple_segments(self):
+    def test_transcribe_audio_multiple_segments(self, whisper_model_stub):
         """Test transcription with multiple segments."""
-        mock_model = MagicMock()
         mock_segments = [
             MagicMock(text="Hello"),
             MagicMock(text=" world"),
             MagicMock(text="!"),
         ]
-        mock_model.transcribe.return_value = (mock_segments, {})
+        whisper_model_stub.transcribe.return_value = (mock_segments, {})
 
         audio_data = b"fake audio data"
-        result = transcribe_audio(mock_model, audio_data)
+        result = transcribe_audio(whisper_model_stub, audio_data)
 
         assert result == "Hello world!"
 
-    def test_transcribe_audio_empty_result(self):
+    def test_transcribe_audio_empty_result(self, whisper_model_stub):
         """Test transcription with empty result."""
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = ([], {})
-
         audio_data = b"fake audio data"
-        result = transcribe_audio(mock_model, audio_data)
+        result = transcribe_audio(whisper_model_stub, audio_data)
 
         assert result == ""
 
-    def test_transcribe_audio_error(self):
+    def test_transcribe_audio_defaults_to_greedy_with_fallback(self, whisper_model_stub):
+        """Test that decoding is greedy with a temperature fallback and VAD on."""
+        transcribe_audio(whisper_model_stub, b"fake audio data")
+
+        call_kwargs = whisper_model_stub.transcribe.call_args.kwargs
+        assert call_kwargs["beam_size"] == 1
+        assert call_kwargs["temperature"] == DEFAULT_TEMPERATURES
+        assert call_kwargs["vad_filter"] is True
+        assert call_kwargs["vad_parameters"] is DEFAULT_VAD_OPTIONS
+        assert call_kwargs["condition_on_previous_text"] is False
+        assert call_kwargs["without_timestamps"] is True
+
+    def test_transcribe_audio_with_vad_uses_default_options(self, whisper_model_stub):
+        """Test that VAD filtering falls back to the shared default options."""
+        transcribe_audio(whisper_model_stub, b"fake audio data", vad_filter=True)
+
+        call_kwargs = whisper_model_stub.transcribe.call_args.kwargs
+        assert call_kwargs["vad_filter"] is True
+        assert call_kwargs["vad_parameters"] is DEFAULT_VAD_OPTIONS
+
+    def test_transcribe_audio_with_custom_vad_parameters(self, whisper_model_stub):
+        """Test that explicit VAD parameters are passed through unchanged."""
+        params = {"threshold": 0.6}
+
+        transcribe_audio(
+            whisper_model_stub, b"fake audio data", vad_filter=True, vad_parameters=params
+        )
+
+        assert whisper_model_stub.transcribe.call_args.kwargs["vad_parameters"] is params
+
+    def test_transcribe_audio_error(self, whisper_model_stub):
         """Test transcription error handling."""
-        mock_model = MagicMock()
-        mock_model.transcribe.side_effect = Exception("Transcription failed")
+        whisper_model_stub.transcribe.side_effect = Exception("Transcription failed")
 
         audio_data = b"fake audio data"
         with pytest.raises(TranscriptionError, match="Transcription failed"):
-            transcribe_audio(mock_model, audio_data)
+            transcribe_audio(whisper_model_stub, audio_data)
+
+    def test_warm_up_model_drains_silent_transcription(self, whisper_model_stub):
+        """Test that warm-up runs a greedy pass over one second of silence."""
+        segments = MagicMock()
+        segments.__iter__.return_value = iter([MagicMock(text="")])
+        whisper_model_stub.transcribe.return_value = (segments, {})
+
+        warm_up_model(whisper_model_stub)
+
+        audio = whisper_model_stub.transcribe.call_args.args[0]
+        assert audio.shape == (16000,)
+        assert not audio.any()
+        assert whisper_model_stub.transcribe.call_args.kwargs["beam_size"] == 1
+        segments.__iter__.assert_called_once()
+
+    def test_warm_up_model_ignores_errors(self, whisper_model_stub):
+        """Test that a failed warm-up does not raise."""
+        whisper_model_stub.transcribe.side_effect = RuntimeError("CUDA not ready")
+
+        warm_up_model(whisper_model_stub)  # Should not raise
+
+    def test_resolved_compute_type_reads_backend(self, whisper_model_stub):
+        """Test that the backend's chosen compute type is reported."""
+        whisper_model_stub.model.compute_type = "int8_float16"
+
+        assert resolved_compute_type(whisper_model_stub) == "int8_float16"
+
+    def test_resolved_compute_type_missing(self):
+        """Test that None is returned when the backend does not report a type."""
+        assert resolved_compute_type(object()) is None
 
     @patch("whisper_dictate.transcription.WhisperModel")
     @patch("whisper_dictate.transcription.normalize_compute_type")
@@ -70,3 +148,55 @@ class TestTranscription:
         assert result == mock_model_instance
         mock_normalize.assert_called_once_with("cuda", "float16")
         mock_whisper_model.assert_called_once_with("small", device="cuda", compute_type="float16")
+
+    @patch("whisper_dictate.transcription.WhisperModel")
+    def test_load_model_reuses_cached_instance(self, mock_whisper_model):
+        """Test that loading the same configuration twice reuses the model."""
+        mock_whisper_model.return_value = MagicMock()
+
+        first = load_model("small", "cuda", "float16")
+        second = load_model("small", "cuda", "float16")
+
+        assert first is second
+        mock_whisper_model.assert_called_once_with("small", device="cuda", compute_type="float16")
+
+    @patch("whisper_dictate.transcription.WhisperModel")
+    def test_load_model_cache_keyed_on_normalized_compute(self, mock_whisper_model):
+        """Test that compute types normalizing to the same value share a cache entry."""
+        load_model("small", "cpu", "float16")
+        load_model("small", "cpu", "int8")
+
+        mock_whisper_model.assert_called_once_with("small", device="cpu", compute_type="int8")
+
+    @patch("whisper_dictate.transcription.WhisperModel")
+    def test_load_model_releases_previous_configuration(self, mock_whisper_model):
+        """Test that switching configuration drops the old model before building the new one."""
+        cached_sizes = []
+
+        def build(*args, **kwargs):
+            cached_sizes.append(transcription._load_cached_model.cache_info().currsize)
+            return MagicMock()
+
+        mock_whisper_model.side_effect = build
+
+        load_model("large-v3", "cuda", "float16")
+        load_model("medium", "cuda", "float16")
+        load_model("large-v3", "cuda", "float16")
+
+        assert cached_sizes == [0, 0, 0]
+        assert mock_whisper_model.call_count == 3
+
+    @patch("whisper_dictate.transcription.WhisperModel")
+    def test_clear_model_cache_forces_reload(self, mock_whisper_model):
+        """Test that clearing the cache constructs a fresh model."""
+        load_model("small", "cuda", "float16")
+        clear_model_cache()
+        load_model("small", "cuda", "float16")
+
+        assert mock_whisper_model.call_count == 2
+
+
+def test_import_defers_faster_whisper():
+    """Importing the module must not pay for faster_whisper until a model is needed."""
+    code = "import sys, whisper_dictate.transcription; sys.exit('faster_whisper' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
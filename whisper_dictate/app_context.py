@@ -4,16 +4,56 @@ from __future__ import annotations
 
 import ctypes
 import ctypes.wintypes
-import platform
+import sys
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-
-if platform.system() == "Windows":
-    USER32 = ctypes.windll.user32
-    KERNEL32 = ctypes.windll.kernel32
-else:
-    USER32 = None
-    KERNEL32 = None
+from typing import Any
+
+
+def _configure_prototypes(user32, kernel32) -> None:
+    """Declare argtypes/restype once so ctypes marshals handles as 64-bit values."""
+    wt = ctypes.wintypes
+
+    user32.GetForegroundWindow.argtypes = []
+    user32.GetForegroundWindow.restype = wt.HWND
+    user32.GetWindowTextLengthW.argtypes = [wt.HWND]
+    user32.GetWindowTextLengthW.restype = ctypes.c_int
+    user32.GetWindowTextW.argtypes = [wt.HWND, wt.LPWSTR, ctypes.c_int]
+    user32.GetWindowTextW.restype = ctypes.c_int
+    user32.GetWindowThreadProcessId.argtypes = [wt.HWND, wt.LPDWORD]
+    user32.GetWindowThreadProcessId.restype = wt.DWORD
+    user32.GetCursorPos.argtypes = [wt.LPPOINT]
+    user32.GetCursorPos.restype = wt.BOOL
+
+    kernel32.OpenProcess.argtypes = [wt.DWORD, wt.BOOL, wt.DWORD]
+    kernel32.OpenProcess.restype = wt.HANDLE
+    kernel32.QueryFullProcessImageNameW.argtypes = [wt.HANDLE, wt.DWORD, wt.LPWSTR, wt.PDWORD]
+    kernel32.QueryFullProcessImageNameW.restype = wt.BOOL
+    kernel32.CloseHandle.argtypes = [wt.HANDLE]
+    kernel32.CloseHandle.restype = wt.BOOL
+
+
+# Private DLL handles rather than the shared ctypes.windll.* objects: prototypes set
+# on those would apply to every library in the process (pyautogui, for one, calls
+# GetCursorPos with its own POINT structure). None when not on Windows.
+USER32: Any = None
+KERNEL32: Any = None
+if sys.platform == "win32":
+    USER32 = ctypes.WinDLL("user32", use_last_error=True)
+    KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _configure_prototypes(USER32, KERNEL32)
+
+
+# Window titles rarely exceed this; longer ones fall back to an exact-size buffer
+TITLE_BUFFER_CHARS = 512
+_thread_local = threading.local()
+
+# Recently seen windows mapped to (pid, process name)
+PROCESS_NAME_CACHE_SIZE = 8
+_PROCESS_NAME_CACHE: dict[int, tuple[int, str]] = {}
+# Overlapping transcription workers can update the cache concurrently
+_PROCESS_NAME_CACHE_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -25,20 +65,38 @@ class ActiveContext:
     cursor_position: tuple[int, int] | None
 
 
+def _title_buffer() -> ctypes.Array[ctypes.c_wchar]:
+    """Return this thread's reusable window title buffer."""
+    buffer = getattr(_thread_local, "title_buffer", None)
+    if buffer is None:
+        buffer = ctypes.create_unicode_buffer(TITLE_BUFFER_CHARS)
+        _thread_local.title_buffer = buffer
+    return buffer
+
+
 def _get_window_title(hwnd: int) -> str | None:
-    length = USER32.GetWindowTextLengthW(hwnd)
-    if length == 0:
+    buffer = _title_buffer()
+    copied = USER32.GetWindowTextW(hwnd, buffer, TITLE_BUFFER_CHARS)
+    if copied >= TITLE_BUFFER_CHARS - 1:
+        # Title may have been truncated; size a buffer for the full length
+        length = USER32.GetWindowTextLengthW(hwnd)
+        buffer = ctypes.create_unicode_buffer(length + 1)
+        copied = USER32.GetWindowTextW(hwnd, buffer, length + 1)
+    if not copied:
         return None
-    buffer = ctypes.create_unicode_buffer(length + 1)
-    if USER32.GetWindowTextW(hwnd, buffer, length + 1):
-        title = buffer.value.strip()
-        return title or None
-    return None
+    title = buffer.value.strip()
+    return title or None
 
 
 def _get_process_name(hwnd: int) -> str | None:
     pid = ctypes.wintypes.DWORD()
     USER32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+
+    # Reuse the last lookup for this window while it belongs to the same process
+    cached = _PROCESS_NAME_CACHE.get(hwnd)
+    if cached is not None and cached[0] == pid.value:
+        return cached[1]
+
     process_query_limited_information = 0x1000
     handle = KERNEL32.OpenProcess(process_query_limited_information, False, pid.value)
     if not handle:
@@ -48,13 +106,23 @@ def _get_process_name(hwnd: int) -> str | None:
         size = ctypes.wintypes.DWORD(1024)
         buffer = ctypes.create_unicode_buffer(size.value)
         if KERNEL32.QueryFullProcessImageNameW(handle, 0, buffer, ctypes.byref(size)):
-            path = Path(buffer.value)
-            return path.name or None
+            name = Path(buffer.value).name or None
+            if name:
+                _cache_process_name(hwnd, pid.value, name)
+            return name
     finally:
         KERNEL32.CloseHandle(handle)
     return None
 
 
+def _cache_process_name(hwnd: int, pid: int, name: str) -> None:
+    with _PROCESS_NAME_CACHE_LOCK:
+        if hwnd not in _PROCESS_NAME_CACHE and len(_PROCESS_NAME_CACHE) >= PROCESS_NAME_CACHE_SIZE:
+            # Evict the oldest window (dicts preserve insertion order)
+            del _PROCESS_NAME_CACHE[next(iter(_PROCESS_NAME_CACHE))]
+        _PROCESS_NAME_CACHE[hwnd] = (pid, name)
+
+
 def _get_cursor_position() -> tuple[int, int] | None:
     point = ctypes.wintypes.POINT()
     if USER32.GetCursorPos(ctypes.byref(point)):
@@ -90,18 +158,20 @@ def format_context_for_prompt(context: ActiveContext | None) -> str | None:
     if context is None:
         return None
 
-    parts: list[str] = []
-    if context.process_name and context.window_title:
-        parts.append(
-            f"Active application: {context.process_name} (window: {context.window_title})."
-        )
-    elif context.process_name:
-        parts.append(f"Active application: {context.process_name}.")
-    elif context.window_title:
-        parts.append(f"Active window: {context.window_title}.")
+    process_name = context.process_name
+    window_title = context.window_title
+    if process_name and window_title:
+        app = f"Active application: {process_name} (window: {window_title})."
+    elif process_name:
+        app = f"Active application: {process_name}."
+    elif window_title:
+        app = f"Active window: {window_title}."
+    else:
+        app = None
 
     if context.cursor_position:
         x, y = context.cursor_position
-        parts.append(f"Cursor position at screen coordinates x={x}, y={y}.")
+        cursor = f"Cursor position at screen coordinates x={x}, y={y}."
+        return f"{app} {cursor}" if app else cursor
 
-    return " ".join(parts) if parts else None
+    return app
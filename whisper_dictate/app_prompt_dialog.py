@@ -4,10 +4,27 @@ from __future__ import annotations
 
 import re
 import tkinter as tk
+from functools import lru_cache
 from tkinter import StringVar, Toplevel, messagebox, ttk
 
 from whisper_dictate import app_prompts
 
+PREVIEW_MAX_CHARS = 60
+
+
+def _preview(prompt: str) -> str:
+    """Return a single-line prompt preview truncated for the tree view."""
+    text = prompt.strip().replace("\n", " ")
+    if len(text) > PREVIEW_MAX_CHARS:
+        return f"{text[: PREVIEW_MAX_CHARS - 3]}..."
+    return text
+
+
+@lru_cache(maxsize=32)
+def _title_anchor(window_title: str) -> str:
+    """Return an anchored regex matching the window title exactly."""
+    return f"^{re.escape(window_title)}$"
+
 
 class AppPromptDialog(Toplevel):
     """Manage prompts scoped to specific applications."""
@@ -62,11 +79,14 @@ class AppPromptDialog(Toplevel):
         recent_frame = ttk.Labelframe(content, text="Recent apps")
         recent_frame.grid(row=0, column=1, sticky="nsw", padx=(12, 0))
         self.lst_recent = tk.Listbox(recent_frame, height=8, width=18, exportselection=False)
-        for entry in self._recent_entries:
-            label = entry["process_name"]
-            if entry.get("window_title"):
-                label = f"{label} — {entry['window_title']}"
-            self.lst_recent.insert("end", label)
+        labels = [
+            f"{entry['process_name']} — {entry['window_title']}"
+            if entry.get("window_title")
+            else entry["process_name"]
+            for entry in self._recent_entries
+        ]
+        if labels:
+            self.lst_recent.insert("end", *labels)
         self.lst_recent.grid(row=0, column=0, sticky="nsew", padx=8, pady=(6, 4))
         self.lst_recent.bind("<Double-Button-1>", lambda event: self._on_add_from_recent())
         ttk.Button(recent_frame, text="Add from recent", command=self._on_add_from_recent).grid(
@@ -99,22 +119,23 @@ class AppPromptDialog(Toplevel):
     # Helpers
     # ------------------------------------------------------------------
     def _refresh_tree(self) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for idx, entry in enumerate(self.entries):
-            prompt_preview = entry.get("prompt", "").strip().replace("\n", " ")
-            if len(prompt_preview) > 60:
-                prompt_preview = f"{prompt_preview[:57]}..."
-            self.tree.insert(
-                "",
-                "end",
-                iid=f"rule-{idx}",
-                values=(
+        children = self.tree.get_children()
+        if children:
+            # One Tcl call (and one redraw) instead of one per row
+            self.tree.delete(*children)
+        rows = [
+            (
+                f"rule-{idx}",
+                (
                     entry.get("process_name", ""),
                     entry.get("window_title_regex", ""),
-                    prompt_preview,
+                    _preview(entry.get("prompt", "")),
                 ),
             )
+            for idx, entry in enumerate(self.entries)
+        ]
+        for iid, values in rows:
+            self.tree.insert("", "end", iid=iid, values=values)
 
     def _selected_entry(self) -> tuple[int, dict[str, str]] | tuple[None, None]:
         selection = self.tree.selection()
@@ -137,6 +158,7 @@ class AppPromptDialog(Toplevel):
             return None
 
     def _prepare_recent_entries(self, recent_processes: list[str | dict[str, str | None]]) -> None:
+        seen: set[tuple[str, str | None]] = set()
         for entry in recent_processes:
             if isinstance(entry, str):
                 process_name = entry.strip()
@@ -150,6 +172,11 @@ class AppPromptDialog(Toplevel):
             if not process_name:
                 continue
 
+            key = (process_name, window_title)
+            if key in seen:
+                continue
+            seen.add(key)
+
             self._recent_entries.append(
                 {"process_name": process_name, "window_title": window_title}
             )
@@ -158,7 +185,7 @@ class AppPromptDialog(Toplevel):
     # Button callbacks
     # ------------------------------------------------------------------
     def _on_add(self, process_name: str | None = None, window_title: str | None = None) -> None:
-        window_regex = f"^{re.escape(window_title)}$" if window_title else None
+        window_regex = _title_anchor(window_title) if window_title else None
         initial = {
             key: value
             for key, value in {
@@ -5,11 +5,18 @@ from __future__ import annotations
 import logging
 import re
 import threading
-from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 from whisper_dictate.app_context import ActiveContext
 
+try:
+    # Third-party engine that can abort a running match on timeout
+    import regex as _regex
+except ImportError:
+    _regex = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 AppPromptRule = dict[str, str]
@@ -20,6 +27,19 @@ MAX_REGEX_LENGTH = 500  # Maximum characters in regex pattern
 MAX_REPETITION_DEPTH = 1  # Maximum nested repetitions (0=none, 1=(a+)+)
 REGEX_TIMEOUT_SECONDS = 0.5  # Maximum time for regex matching
 
+# Distinct (process, window title) pairs remembered by CompiledAppPrompts.match
+MATCH_CACHE_SIZE = 64
+
+
+# Tokens validate_regex_pattern() cares about; everything else is skipped in C
+_REGEX_TOKEN_RE = re.compile(
+    r"\\(?P<escaped>.)"
+    r"|\((?P<extension>\?(?P<named_ref>P=)?)?"
+    r"|\)(?P<group_rep>[*+?{])?"
+    r"|[*+?{|]",
+    re.DOTALL,
+)
+
 
 class RegexValidationError(Exception):
     """Raised when a regex pattern is potentially dangerous."""
@@ -27,6 +47,61 @@ class RegexValidationError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class CompiledRule:
+    """An app prompt rule whose window title regex has been validated and compiled."""
+
+    prompt: str
+    window_title_regex: str
+    compiled: re.Pattern[str]
+    linear: bool = True
+
+    def matches(self, window_title: str) -> bool:
+        """Return True if the compiled regex matches the window title."""
+        if self.linear:
+            return self.compiled.search(window_title) is not None
+        return _search_with_timeout(self.window_title_regex, window_title, REGEX_TIMEOUT_SECONDS)
+
+
+@dataclass(frozen=True)
+class ProcessRules:
+    """Compiled rules for one process, split into regex rules and the fallback."""
+
+    regex_rules: tuple[CompiledRule, ...] = ()
+    default_prompt: str | None = None
+
+    def resolve(self, window_title: str) -> str | None:
+        """Return the first regex rule matching the title, else the default prompt."""
+        if not window_title:
+            return self.default_prompt
+        return next(
+            (rule.prompt for rule in self.regex_rules if rule.matches(window_title)),
+            self.default_prompt,
+        )
+
+
+class CompiledAppPrompts:
+    """Compiled app prompt rules with memoized lookups.
+
+    Built by compile_app_prompts() and kept in memory only; it is never
+    serialized to settings. Replacing the rules means building a new instance,
+    which also discards the match cache.
+    """
+
+    def __init__(self, rules: dict[str, ProcessRules] | None = None):
+        # Keyed on lowercased process name
+        self.rules: dict[str, ProcessRules] = rules or {}
+        # Per-instance cache so it is dropped together with the rules
+        self.match = lru_cache(maxsize=MATCH_CACHE_SIZE)(self._match)
+
+    def _match(self, process_name: str, window_title: str) -> str | None:
+        """Return the prompt for a process and window title, or None."""
+        rules = self.rules.get(process_name.lower())
+        if rules is None:
+            return None
+        return rules.resolve(window_title)
+
+
 def normalize_app_prompts(data: Any) -> AppPromptMap:
     """Normalize raw settings data into a consistent app prompt map."""
 
@@ -99,12 +174,22 @@ def entries_to_rules(entries: list[dict[str, str]]) -> AppPromptMap:
     return rules
 
 
-def validate_regex_pattern(pattern: str) -> None:
+@lru_cache(maxsize=256)
+def _compile_cached(pattern: str, flags: int) -> re.Pattern[str]:
+    """Compile a regex pattern, memoizing the compiled object."""
+    return re.compile(pattern, flags)
+
+
+def validate_regex_pattern(pattern: str) -> bool:
     """Validate a regex pattern to prevent ReDoS attacks.
 
     Args:
         pattern: The regex pattern to validate
 
+    Returns:
+        True if the pattern is statically linear-time (no quantifiers,
+        alternation, or backreferences) and can be matched without a timeout
+
     Raises:
         RegexValidationError: If pattern is potentially dangerous
         re.error: If pattern has invalid syntax
@@ -118,15 +203,29 @@ def validate_regex_pattern(pattern: str) -> None:
     # Check for excessive nesting of repetition operators
     # Patterns like (a+)+ or (a*)* can cause catastrophic backtracking
     # We track nesting depth of groups that contain repetitions
-    group_stack = []  # Stack of (has_repetition_inside, has_repetition_after)
+    group_stack: list[list[bool]] = []  # Stack of (has_repetition_inside, has_repetition_after)
     max_nested_reps = 0
-
-    i = 0
-    while i < len(pattern):
-        char = pattern[i]
-
-        if char == "(":
-            if i + 1 < len(pattern) and pattern[i + 1] != "?":
+    # Constructs that allow backtracking; without them matching is linear
+    has_backtracking = False
+
+    for token in _REGEX_TOKEN_RE.finditer(pattern):
+        char = token.group(0)[0]
+
+        if char == "\\":
+            # Escaped character, noting numeric backreferences
+            if token.group("escaped").isdigit():
+                has_backtracking = True
+
+        elif char == "(":
+            if token.group("extension") is not None:
+                # "(?" opens a group extension rather than quantifying, but
+                # still marks the enclosing group as repeated
+                if group_stack:
+                    group_stack[-1][0] = True
+                if token.group("named_ref"):
+                    # Named backreference
+                    has_backtracking = True
+            elif token.end() < len(pattern):
                 # Start of capturing group
                 group_stack.append([False, False])  # [has_rep_inside, has_rep_after]
 
@@ -134,35 +233,36 @@ def validate_regex_pattern(pattern: str) -> None:
             if group_stack:
                 has_rep_inside, _ = group_stack.pop()
                 # Check if this group is followed by a repetition
-                if i + 1 < len(pattern) and pattern[i + 1] in "*+?{":
+                if token.group("group_rep"):
                     # This group has a repetition after it
                     if has_rep_inside:
                         # We have (something_with_repetition)+ which is dangerous
                         # Count depth: how many groups with repetitions are we nested in?
                         depth = 1 + sum(1 for g in group_stack if g[0])
                         max_nested_reps = max(max_nested_reps, depth)
-                    # Mark parent group as having repetition inside
-                    if group_stack:
-                        group_stack[-1][0] = True
+            if token.group("group_rep"):
+                # The repetition itself marks the parent group and allows backtracking
+                if group_stack:
+                    group_stack[-1][0] = True
+                has_backtracking = True
+
+        elif char == "|":
+            has_backtracking = True
 
-        elif char in "*+?{":
+        else:
             # Mark current group as having repetition inside
             if group_stack:
                 group_stack[-1][0] = True
-
-        elif char == "\\":
-            # Skip escaped characters
-            i += 1
-
-        i += 1
+            has_backtracking = True
 
     if max_nested_reps >= MAX_REPETITION_DEPTH:
         raise RegexValidationError(
             f"Regex has too many nested repetitions ({max_nested_reps} >= {MAX_REPETITION_DEPTH})"
         )
 
-    # Try to compile to check for syntax errors
-    re.compile(pattern)
+    # Compile to check for syntax errors; this also warms the match-time cache
+    _compile_cached(pattern, re.IGNORECASE)
+    return not has_backtracking
 
 
 def safe_regex_search(pattern: str, text: str, timeout: float = REGEX_TIMEOUT_SECONDS) -> bool:
@@ -177,22 +277,36 @@ def safe_regex_search(pattern: str, text: str, timeout: float = REGEX_TIMEOUT_SE
         True if pattern matches, False otherwise
 
     Note:
-        Returns False on timeout or validation errors to fail safe
+        Returns False on timeout or validation errors to fail safe. When the
+        optional `regex` package is installed its native timeout aborts the
+        match; otherwise a watchdog thread bounds how long we wait.
     """
     try:
         # Validate pattern first
-        validate_regex_pattern(pattern)
+        linear = validate_regex_pattern(pattern)
     except (RegexValidationError, re.error) as e:
         logger.warning(f"Invalid regex pattern '{pattern}': {e}")
         return False
 
+    if linear:
+        # Cannot backtrack catastrophically; skip the watchdog thread
+        return _compile_cached(pattern, re.IGNORECASE).search(text) is not None
+
+    return _search_with_timeout(pattern, text, timeout)
+
+
+def _search_with_timeout(pattern: str, text: str, timeout: float) -> bool:
+    """Search an already-validated pattern, bounding how long the match may run."""
+    if _regex is not None:
+        return _timeout_search(pattern, text, timeout)
+
     # Perform match with timeout
     result = [False]  # Use list to avoid closure issues
     exception = [None]  # Capture any exception
 
     def do_match():
         try:
-            compiled = re.compile(pattern, re.IGNORECASE)
+            compiled = _compile_cached(pattern, re.IGNORECASE)
             result[0] = compiled.search(text) is not None
         except Exception as e:
             exception[0] = e
@@ -213,37 +327,86 @@ def safe_regex_search(pattern: str, text: str, timeout: float = REGEX_TIMEOUT_SE
     return result[0]
 
 
-def resolve_app_prompt(app_prompts: AppPromptMap, context: ActiveContext | None) -> str | None:
-    """Return the best-matching prompt for the given active context."""
+@lru_cache(maxsize=256)
+def _compile_with_timeout_engine(pattern: str) -> Any:
+    """Compile a pattern with the `regex` engine (re-compatible VERSION0 syntax)."""
+    return _regex.compile(pattern, _regex.VERSION0 | _regex.IGNORECASE)
 
-    if context is None or not context.process_name:
-        return None
 
-    rules = app_prompts.get(context.process_name)
-    if not rules:
-        return None
+def _timeout_search(pattern: str, text: str, timeout: float) -> bool:
+    """Search using the `regex` engine's native timeout, which stops the match."""
+    try:
+        return _compile_with_timeout_engine(pattern).search(text, timeout=timeout) is not None
+    except TimeoutError:
+        logger.warning(f"Regex '{pattern}' timed out after {timeout}s (potential ReDoS)")
+        return False
+    except _regex.error as e:
+        logger.warning(f"Regex '{pattern}' raised exception: {e}")
+        return False
 
-    window_title = context.window_title or ""
-    default_prompt: str | None = None
 
-    for rule in rules:
-        prompt = rule.get("prompt")
-        if not prompt:
-            continue
+def compile_app_prompts(app_prompts: AppPromptMap) -> CompiledAppPrompts:
+    """Validate and compile every rule's window title regex up front.
+
+    Call this whenever the rules change so that resolving a prompt at the end
+    of each dictation only runs the search. Process names are matched
+    case-insensitively; rules whose regex fails validation are dropped.
+    """
+    regex_rules: dict[str, list[CompiledRule]] = {}
+    defaults: dict[str, str] = {}
+
+    for process, rules in app_prompts.items():
+        key = process.lower()
+        process_regex_rules = regex_rules.setdefault(key, [])
+        for rule in rules:
+            prompt = rule.get("prompt")
+            if not prompt:
+                continue
+            regex = rule.get("window_title_regex")
+            if not regex:
+                defaults.setdefault(key, prompt)
+                continue
+            try:
+                linear = validate_regex_pattern(regex)
+            except (RegexValidationError, re.error) as e:
+                logger.warning(f"Invalid regex pattern '{regex}': {e}")
+                continue
+            process_regex_rules.append(
+                CompiledRule(prompt, regex, _compile_cached(regex, re.IGNORECASE), linear)
+            )
+
+    return CompiledAppPrompts(
+        {
+            key: ProcessRules(tuple(rules), defaults.get(key))
+            for key, rules in regex_rules.items()
+            if rules or key in defaults
+        }
+    )
 
-        regex = rule.get("window_title_regex")
-        if regex and window_title:
-            # Use safe regex matching with timeout protection
-            if safe_regex_search(regex, window_title):
-                return prompt
 
-        if not regex and default_prompt is None:
-            default_prompt = prompt
+def resolve_app_prompt(app_prompts: AppPromptMap, context: ActiveContext | None) -> str | None:
+    """Return the best-matching prompt for the given active context.
+
+    Compiles the rules on each call; hot paths should keep a map from
+    compile_app_prompts() and use resolve_compiled_app_prompt().
+    """
+
+    return resolve_compiled_app_prompt(compile_app_prompts(app_prompts), context)
+
+
+def resolve_compiled_app_prompt(
+    compiled: CompiledAppPrompts, context: ActiveContext | None
+) -> str | None:
+    """Return the best-matching prompt using rules from compile_app_prompts()."""
+
+    if context is None or not context.process_name:
+        return None
 
-    return default_prompt
+    return compiled.match(context.process_name, context.window_title or "")
 
 
 def clone_rules(app_prompts: AppPromptMap) -> AppPromptMap:
     """Return a deep copy of app prompt rules for safe editing."""
 
-    return deepcopy(app_prompts)
+    # Rules only hold strings, so copying the two container levels is a full copy
+    return {process: [dict(rule) for rule in rules] for process, rules in app_prompts.items()}
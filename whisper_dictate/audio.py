@@ -1,6 +1,5 @@
 """Audio recording functionality."""
 
-import queue
 import threading
 
 import numpy as np
@@ -8,9 +7,15 @@ import sounddevice as sd
 
 from whisper_dictate.config import CHUNK_MS, INPUT_CHANNELS, SAMPLE_RATE
 
+# Seconds of audio preallocated per recorder; the buffer doubles if exceeded
+INITIAL_BUFFER_SECONDS = 60
+
+# Peak amplitude below which a recording is treated as silence (about -60 dBFS)
+SILENCE_PEAK = 1e-3
+
 
 class AudioRecorder:
-    """Manages audio recording with background buffering."""
+    """Manages audio recording into a preallocated sample buffer."""
 
     def __init__(
         self,
@@ -31,31 +36,41 @@ class AudioRecorder:
         self.chunk_ms = chunk_ms
 
         self._recording = False
-        self._audio_queue: queue.Queue[np.ndarray] = queue.Queue()
-        self._audio_buffer: list[np.ndarray] = []
+        # Mono samples written directly by the stream callback; no per-chunk arrays
+        self._buffer = np.empty(sample_rate * INITIAL_BUFFER_SECONDS, dtype=np.float32)
+        self._write_pos = 0
         self._buffer_lock = threading.Lock()
         self._stream: sd.InputStream | None = None
-        self._recorder_thread: threading.Thread | None = None
-        self._stop_recorder = threading.Event()
+        self._teardown_thread: threading.Thread | None = None
 
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info: dict, status) -> None:
         """Callback for audio input stream."""
         if status:
             print("Audio status:", status)
-        # Convert to mono if necessary
-        data = indata if indata.ndim == 1 else np.mean(indata, axis=1)
-        self._audio_queue.put_nowait(data.copy())
-
-    def _recorder_loop(self) -> None:
-        """Background thread that collects audio chunks from the queue."""
-        while not self._stop_recorder.is_set():
-            try:
-                # Use timeout to allow checking stop flag
-                chunk = self._audio_queue.get(timeout=0.1)
-                with self._buffer_lock:
-                    self._audio_buffer.append(chunk)
-            except queue.Empty:
-                continue
+        n = len(indata)
+        with self._buffer_lock:
+            end = self._write_pos + n
+            if end > len(self._buffer):
+                self._grow_buffer(end)
+            out = self._buffer[self._write_pos : end]
+            # Convert to mono if necessary, writing straight into the buffer
+            if indata.ndim == 1:
+                out[:] = indata
+            elif indata.shape[1] == 1:
+                out[:] = indata[:, 0]
+            else:
+                np.mean(indata, axis=1, out=out)
+            self._write_pos = end
+
+    def _grow_buffer(self, min_size: int) -> None:
+        """Enlarge the sample buffer to hold at least min_size samples.
+
+        Must be called with the buffer lock held.
+        """
+        new_size = max(min_size, 2 * len(self._buffer))
+        grown = np.empty(new_size, dtype=np.float32)
+        grown[: self._write_pos] = self._buffer[: self._write_pos]
+        self._buffer = grown
 
     def start(self, device: int | None = None) -> None:
         """
@@ -64,15 +79,12 @@ class AudioRecorder:
         Args:
             device: Audio input device ID (None for default)
         """
+        # The previous stream must be fully released before reopening the device
+        self._wait_for_teardown()
+
         # Clear existing buffer
         with self._buffer_lock:
-            self._audio_buffer = []
-
-        # Start recorder thread if not already running
-        if self._recorder_thread is None or not self._recorder_thread.is_alive():
-            self._stop_recorder.clear()
-            self._recorder_thread = threading.Thread(target=self._recorder_loop, daemon=True)
-            self._recorder_thread.start()
+            self._write_pos = 0
 
         # Create and start audio stream
         self._stream = sd.InputStream(
@@ -87,31 +99,53 @@ class AudioRecorder:
         self._recording = True
 
     def stop(self) -> None:
-        """Stop audio recording."""
-        if self._stream:
-            try:
-                self._stream.stop()
-                self._stream.close()
-            except (sd.PortAudioError, RuntimeError, AttributeError):
-                # PortAudioError: PortAudio/sounddevice errors
-                # RuntimeError: Stream already closed or invalid state
-                # AttributeError: Stream object is invalid
-                pass
-            self._stream = None
+        """Stop audio recording.
+
+        The stream is stopped and closed on a background thread so the caller
+        (typically the UI thread) does not wait for the audio driver.
+        """
+        stream, self._stream = self._stream, None
         self._recording = False
+        if stream is not None:
+            self._teardown_thread = threading.Thread(
+                target=self._close_stream, args=(stream,), daemon=True
+            )
+            self._teardown_thread.start()
+
+    @staticmethod
+    def _close_stream(stream: sd.InputStream) -> None:
+        """Stop and close a stream, ignoring driver errors."""
+        try:
+            stream.stop()
+            stream.close()
+        except (sd.PortAudioError, RuntimeError, AttributeError):
+            # PortAudioError: PortAudio/sounddevice errors
+            # RuntimeError: Stream already closed or invalid state
+            # AttributeError: Stream object is invalid
+            pass
+
+    def _wait_for_teardown(self, timeout: float | None = None) -> None:
+        """Block until a stream closed by stop() has been released."""
+        if self._teardown_thread is not None:
+            self._teardown_thread.join(timeout)
+            if not self._teardown_thread.is_alive():
+                self._teardown_thread = None
 
     def get_buffer(self) -> np.ndarray | None:
         """
         Get and clear the audio buffer.
 
         Returns:
-            Concatenated audio data, or None if buffer is empty
+            Recorded audio data, or None if buffer is empty
         """
         with self._buffer_lock:
-            if not self._audio_buffer:
+            if not self._write_pos:
                 return None
-            audio = np.concatenate(self._audio_buffer).astype(np.float32)
-            self._audio_buffer.clear()
+            # Hand the filled slice over as a view instead of copying it, and
+            # let the next recording write into a fresh buffer
+            audio = self._buffer[: self._write_pos]
+            self._buffer = np.empty(self.sample_rate * INITIAL_BUFFER_SECONDS, dtype=np.float32)
+            self._write_pos = 0
             return audio
 
     def is_recording(self) -> bool:
@@ -121,9 +155,7 @@ class AudioRecorder:
     def shutdown(self) -> None:
         """Shutdown the recorder and cleanup resources."""
         self.stop()
-        self._stop_recorder.set()
-        if self._recorder_thread and self._recorder_thread.is_alive():
-            self._recorder_thread.join(timeout=1.0)
+        self._wait_for_teardown(timeout=1.0)
 
 
 # Global singleton instance for backward compatibility
@@ -131,6 +163,18 @@ _default_recorder: AudioRecorder | None = None
 _recorder_lock = threading.Lock()
 
 
+def is_silent(samples: np.ndarray, threshold: float = SILENCE_PEAK) -> bool:
+    """Return True if no sample reaches the threshold amplitude.
+
+    Lets callers skip transcription entirely when the microphone picked up
+    nothing, e.g. a muted input or an accidental hotkey press.
+    """
+    if not samples.size:
+        return True
+    # max/min scan the buffer in place; np.abs() would allocate a full copy
+    return max(float(samples.max()), -float(samples.min())) < threshold
+
+
 def get_default_recorder() -> AudioRecorder:
     """Get or create the default global audio recorder instance."""
     global _default_recorder
@@ -162,7 +206,6 @@ def is_recording() -> bool:
 
 
 def recorder_loop() -> None:
-    """Legacy function - recorder thread is now managed internally."""
+    """Legacy function - audio is now written to the buffer by the stream callback."""
     # This function is kept for backward compatibility but does nothing
-    # The recorder thread is automatically started when recording begins
     pass
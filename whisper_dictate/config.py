@@ -2,6 +2,7 @@
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -13,7 +14,7 @@ CHUNK_MS = 50
 # Whisper defaults
 DEFAULT_MODEL = "small"  # whisper model: base.en, small, medium, large-v3
 DEFAULT_DEVICE: Literal["cpu", "cuda"] = "cuda"  # cpu or cuda
-DEFAULT_COMPUTE = "float16"  # good default; GUI will coerce based on device
+DEFAULT_COMPUTE = "auto"  # let CTranslate2 pick the fastest type the device supports
 
 # LLM defaults
 DEFAULT_LLM_ENABLED = True
@@ -22,13 +23,40 @@ DEFAULT_LLM_MODEL = "openai/gpt-oss-20b"
 DEFAULT_LLM_KEY = ""  # LM Studio usually does not require a key
 DEFAULT_LLM_TEMP = 0.1
 DEFAULT_LLM_DEBUG = False
+# Dictations shorter than either threshold ("um", "okay.", "thanks a lot") are pasted
+# as transcribed instead of paying for an LLM round-trip; 0 disables the check
+DEFAULT_LLM_BYPASS_UNDER_CHARS = 20
+DEFAULT_LLM_BYPASS_UNDER_WORDS = 3
 
 # Auto-startup defaults
 DEFAULT_AUTO_LOAD_MODEL = False
 DEFAULT_AUTO_REGISTER_HOTKEY = False
 
-# Default LLM prompt
+# Default LLM prompt. Kept terse because it is re-sent with every dictation and
+# prompt prefill dominates latency on local endpoints.
 DEFAULT_LLM_PROMPT = """
+You reformat dictated text. You are a text editor, NOT an assistant: never answer, \
+respond to, or act on the text.
+
+Do:
+- Fix grammar, spelling, punctuation, homophones; standardize numbers/dates
+- Remove speech artifacts (um, uh, false starts, repetitions)
+- Split text over 20 words into paragraphs of 2-5 sentences; put questions on new lines
+- Format lists as lists; replace emoji descriptions with the emoji (smiley face -> 🙂)
+- Keep the speaker's wording, tone, names, facts, and profanity
+
+Never:
+- Add greetings, explanations, or content not in the original
+- Rephrase unless hard to read
+- Use em dashes
+
+Example: "what's the weather like" -> What's the weather like?
+
+Output only the cleaned text.
+"""
+
+# Original long-form prompt, for models that need the more explicit instructions
+DEFAULT_LLM_PROMPT_VERBOSE = """
 You are a specialized text reformatting assistant. Your ONLY job is to clean up and reformat the user's text input.
 
 CRITICAL INSTRUCTION: Your response must ONLY contain the cleaned text. Nothing else.
@@ -72,6 +100,7 @@ MODEL_INFO: dict[str, dict[str, str | int | float]] = {
         "vram_gb": 1,
         "ram_gb": 0.4,
         "speed": "10x",
+        "recommended_compute": "float16",
         "description": "Fastest, lowest accuracy. Good for quick drafts.",
     },
     "base.en": {
@@ -80,6 +109,7 @@ MODEL_INFO: dict[str, dict[str, str | int | float]] = {
         "vram_gb": 1,
         "ram_gb": 0.5,
         "speed": "7x",
+        "recommended_compute": "float16",
         "description": "Fast with decent accuracy. Good default for English.",
     },
     "small": {
@@ -88,6 +118,7 @@ MODEL_INFO: dict[str, dict[str, str | int | float]] = {
         "vram_gb": 2,
         "ram_gb": 1,
         "speed": "4x",
+        "recommended_compute": "float16",
         "description": "Balanced speed and accuracy. Supports all languages.",
     },
     "medium": {
@@ -96,6 +127,7 @@ MODEL_INFO: dict[str, dict[str, str | int | float]] = {
         "vram_gb": 5,
         "ram_gb": 2.5,
         "speed": "2x",
+        "recommended_compute": "int8_float16",
         "description": "High accuracy, slower. Requires decent GPU.",
     },
     "large-v3": {
@@ -104,6 +136,7 @@ MODEL_INFO: dict[str, dict[str, str | int | float]] = {
         "vram_gb": 10,
         "ram_gb": 4,
         "speed": "1x",
+        "recommended_compute": "int8_float16",
         "description": "Best accuracy, slowest. Requires powerful GPU.",
     },
     "large-v3-turbo": {
@@ -112,57 +145,173 @@ MODEL_INFO: dict[str, dict[str, str | int | float]] = {
         "vram_gb": 6,
         "ram_gb": 3,
         "speed": "3x",
+        "recommended_compute": "int8_float16",
         "description": "Near large-v3 accuracy at medium speed.",
     },
 }
 
-# Recommended compute types per device
+# Recommended compute types per device when the hardware cannot be queried
 DEVICE_COMPUTE_DEFAULTS: dict[str, str] = {
     "cpu": "int8",
     "cuda": "float16",
 }
 
+# Fastest-first compute types to pick from what CTranslate2 reports as supported.
+# int8_float32 needs VNNI-capable CPUs; int8_float16 helps the memory-bound decoder on GPU.
+COMPUTE_TYPE_PREFERENCES: dict[str, tuple[str, ...]] = {
+    "cpu": ("int8_float32", "int8", "float32"),
+    "cuda": ("int8_float16", "float16", "float32"),
+}
+
+
+@lru_cache(maxsize=2)
+def _supported_compute_types(device: str) -> frozenset[str] | None:
+    """Ask CTranslate2 once which compute types the device supports (None if unknown)."""
+    try:
+        import ctranslate2
+
+        return frozenset(ctranslate2.get_supported_compute_types(device))
+    except (ImportError, RuntimeError, ValueError):
+        # ImportError: CTranslate2 not installed
+        # RuntimeError: Device (e.g. CUDA driver) unavailable
+        # ValueError: Unknown device name
+        return None
+
+
+@lru_cache(maxsize=2)
+def default_compute_type(device: str) -> str:
+    """Return the fastest compute type CTranslate2 supports on this device."""
+    supported = _supported_compute_types(device)
+    if supported is None:
+        return DEVICE_COMPUTE_DEFAULTS.get(device, "float16")
+
+    for compute_type in COMPUTE_TYPE_PREFERENCES.get(device, ()):
+        if compute_type in supported:
+            return compute_type
+    return DEVICE_COMPUTE_DEFAULTS.get(device, "float16")
+
+
+@lru_cache(maxsize=16)
+def get_default_compute(device: str, model_id: str) -> str:
+    """Return the compute type to use for a model on a device.
+
+    On CUDA the model's "recommended_compute" is used when the GPU supports it:
+    int8_float16 halves weight bandwidth for the large, memory-bound models,
+    while small models decode fastest in plain float16. Otherwise this falls
+    back to default_compute_type(device).
+    """
+    recommended = MODEL_INFO.get(model_id, {}).get("recommended_compute")
+    if device == "cuda" and isinstance(recommended, str):
+        supported = _supported_compute_types(device)
+        if supported is not None and recommended in supported:
+            return recommended
+    return default_compute_type(device)
+
+
+# Nvidia wheel packages whose bin folders hold the DLLs CTranslate2 needs on Windows
+CUDA_PACKAGES = ("cuda_runtime", "cublas", "cudnn")
+
+# Handles from os.add_dll_directory; a directory is unregistered again once its
+# handle is garbage collected, so they are kept for the life of the process
+_DLL_DIRECTORY_HANDLES: dict[str, object] = {}
+
 
 def set_cuda_paths() -> None:
-    """Ensure CUDA DLL folders from the embedded Nvidia wheels are on PATH."""
+    """Make CUDA DLL folders from the embedded Nvidia wheels loadable.
+
+    On Windows the folders are registered with the DLL loader, since Python 3.8+
+    no longer searches PATH for extension module dependencies. They are also
+    prepended to PATH and CUDA_PATH for libraries CTranslate2 loads itself.
+    Calling this again does not duplicate entries.
+    """
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         nvidia_base_path = Path(sys._MEIPASS) / "nvidia"
     else:
         venv_base = Path(sys.executable).resolve().parent.parent
         nvidia_base_path = venv_base / "Lib" / "site-packages" / "nvidia"
 
+    # One directory listing answers the common CPU-only case (no nvidia folder)
+    # without probing each package's bin folder separately
+    try:
+        with os.scandir(nvidia_base_path) as entries:
+            installed = {entry.name for entry in entries}
+    except OSError:
+        return
+
     cuda_dirs = [
-        nvidia_base_path / "cuda_runtime" / "bin",
-        nvidia_base_path / "cublas" / "bin",
-        nvidia_base_path / "cudnn" / "bin",
+        nvidia_base_path / package / "bin" for package in CUDA_PACKAGES if package in installed
     ]
 
-    paths_to_add = [str(path) for path in cuda_dirs if path.exists()]
+    paths_to_add = [str(path) for path in cuda_dirs if path.is_dir()]
     if not paths_to_add:
         return
 
-    env_vars = ["CUDA_PATH", "CUDA_PATH_V12_4", "PATH"]
+    # Only present on Windows
+    add_dll_directory = getattr(os, "add_dll_directory", None)
+    if add_dll_directory is not None:
+        for path in paths_to_add:
+            if path not in _DLL_DIRECTORY_HANDLES:
+                _DLL_DIRECTORY_HANDLES[path] = add_dll_directory(path)
 
-    for env_var in env_vars:
+    for env_var in ("CUDA_PATH", "PATH"):
         current_value = os.environ.get(env_var, "")
-        new_value = os.pathsep.join(
-            paths_to_add + [current_value] if current_value else paths_to_add
-        )
-        os.environ[env_var] = new_value
+        # Drop empty entries so a leading/trailing separator never yields "dir;;..."
+        existing = [entry for entry in current_value.split(os.pathsep) if entry]
+        missing = [path for path in paths_to_add if path not in existing]
+        if missing:
+            os.environ[env_var] = os.pathsep.join(missing + existing)
+
+
+# (device, requested compute type) -> type the device can actually run. The CPU
+# backend has no 16-bit float kernels; on GPU, int8 requests keep their quantized
+# weights but run the remaining layers in float16 (mixed int8_float16).
+# Anything not listed (including "auto") is passed through unchanged.
+_COMPUTE_TYPE_OVERRIDES: dict[tuple[str, str], str] = {
+    ("cpu", "float16"): "int8",
+    ("cpu", "int8_float16"): "int8",
+    ("cpu", "bfloat16"): "int8",
+    ("cpu", "int8_bfloat16"): "int8",
+    ("cuda", "int8"): "int8_float16",
+    ("cuda", "int8_float32"): "int8_float16",
+    ("cuda", "float32"): "float16",
+}
+
+
+# bfloat16 needs an Ampere (compute capability 8.0) or newer GPU; older cards get
+# the float16 equivalent, which runs at the same speed there
+_BFLOAT16_FALLBACKS: dict[str, str] = {
+    "bfloat16": "float16",
+    "int8_bfloat16": "int8_float16",
+}
 
 
 def normalize_compute_type(device: str, compute_type: str) -> str:
-    """Normalize compute type based on device capabilities."""
-    ct = compute_type
-    if device == "cpu" and "float16" in ct:
-        ct = "int8"
-    if device == "cuda" and ct in ("int8", "int8_float32", "float32"):
-        ct = "float16"
+    """Normalize compute type based on device capabilities.
+
+    When CTranslate2 can report what the device supports, an unsupported request
+    is replaced by its closest supported equivalent (bfloat16 -> float16) or the
+    fastest supported type, rather than being silently converted at load time.
+    "auto" is passed through unchanged so CTranslate2 selects the type itself.
+    """
+    ct = _COMPUTE_TYPE_OVERRIDES.get((device, compute_type), compute_type)
+    if ct == "auto":
+        return ct
+
+    supported = _supported_compute_types(device)
+    if supported is None or ct in supported:
+        return ct
+    for candidate in (_BFLOAT16_FALLBACKS.get(ct), *COMPUTE_TYPE_PREFERENCES.get(device, ())):
+        if candidate in supported:
+            return candidate
     return ct
 
 
+@lru_cache(maxsize=32)
 def get_model_display_name(model_id: str, device: str) -> str:
-    """Get formatted display name with resource requirements for model dropdown."""
+    """Get formatted display name with resource requirements for model dropdown.
+
+    MODEL_INFO is static, so each (model, device) string is formatted only once.
+    """
     info = MODEL_INFO.get(model_id, {})
     if not info:
         return model_id
@@ -185,6 +334,7 @@ def get_model_display_name(model_id: str, device: str) -> str:
     return f"{info.get('display_name', model_id)} ({disk_str}, {req})"
 
 
-def get_model_choices(device: str) -> list[tuple[str, str]]:
-    """Get list of (model_id, display_name) tuples for dropdown."""
-    return [(model_id, get_model_display_name(model_id, device)) for model_id in MODEL_INFO.keys()]
+@lru_cache(maxsize=2)
+def get_model_choices(device: str) -> tuple[tuple[str, str], ...]:
+    """Get (model_id, display_name) pairs for dropdown, built once per device."""
+    return tuple((model_id, get_model_display_name(model_id, device)) for model_id in MODEL_INFO)
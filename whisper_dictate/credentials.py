@@ -5,13 +5,34 @@ the system's native credential storage (Windows Credential Manager on Windows).
 Credentials are encrypted by the operating system and tied to the user account.
 """
 
-import logging
+from __future__ import annotations
 
-import keyring
-from keyring.errors import KeyringError, PasswordDeleteError
+import logging
+import sys
+from types import ModuleType
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+
+def __getattr__(name: str) -> Any:
+    # Importing keyring loads its backend machinery and platform bindings (~0.1 s);
+    # defer that until a credential is actually read or written
+    if name == "keyring":
+        import keyring
+
+        globals()["keyring"] = keyring
+        return keyring
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _keyring() -> ModuleType:
+    """Return the keyring module, importing it on first use."""
+    # Resolved through the module so the lazy import (and test patches) apply
+    module: ModuleType = sys.modules[__name__].keyring
+    return module
+
+
 # Service name for keyring storage
 SERVICE_NAME = "WhisperDictate"
 
@@ -42,8 +63,10 @@ def store_credential(key: str, value: str) -> None:
     if not value or not value.strip():
         raise ValueError("Credential value cannot be empty")
 
+    from keyring.errors import KeyringError
+
     try:
-        keyring.set_password(SERVICE_NAME, key, value)
+        _keyring().set_password(SERVICE_NAME, key, value)
         logger.info(f"Stored credential: {key}")
     except KeyringError as e:
         logger.error(f"Failed to store credential {key}: {e}")
@@ -70,8 +93,10 @@ def retrieve_credential(key: str) -> str | None:
     if not key or not key.strip():
         raise ValueError("Credential key cannot be empty")
 
+    from keyring.errors import KeyringError
+
     try:
-        value = keyring.get_password(SERVICE_NAME, key)
+        value: str | None = _keyring().get_password(SERVICE_NAME, key)
         if value:
             logger.debug(f"Retrieved credential: {key}")
         else:
@@ -99,8 +124,10 @@ def delete_credential(key: str) -> None:
     if not key or not key.strip():
         raise ValueError("Credential key cannot be empty")
 
+    from keyring.errors import KeyringError, PasswordDeleteError
+
     try:
-        keyring.delete_password(SERVICE_NAME, key)
+        _keyring().delete_password(SERVICE_NAME, key)
         logger.info(f"Deleted credential: {key}")
     except PasswordDeleteError:
         # Credential doesn't exist - not an error
@@ -4,18 +4,48 @@ from __future__ import annotations
 
 import csv
 import json
+import logging
+import os
 import re
+import sys
 from collections.abc import Iterable
+from contextlib import suppress
 from dataclasses import dataclass, field
 from io import StringIO
 from pathlib import Path
-from typing import Literal
+from stat import S_ISREG
+from typing import Literal, cast
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+logger = logging.getLogger(__name__)
 
 MatchType = Literal["word", "phrase", "regex"]
 
 # Store structured glossary rules in a JSON file alongside other app data
 GLOSSARY_FILE = Path.home() / ".whisper_dictate/whisper_dictate_glossary.json"
 
+# Column order for CSV export; import_csv reads columns by these names
+_CSV_FIELDS = (
+    "trigger",
+    "replacement",
+    "match_type",
+    "case_sensitive",
+    "word_boundary",
+    "description",
+)
+
+# Spellings accepted for boolean CSV columns; anything else keeps the column default
+_CSV_TRUE = frozenset({"true", "1", "yes", "y", "t"})
+_CSV_FALSE = frozenset({"false", "0", "no", "n", "f"})
+
+# Loaded managers keyed by path, reused while the file's (mtime_ns, size) is unchanged
+# so each dictation costs one stat() instead of a read and JSON parse
+_LOAD_CACHE: dict[Path, tuple[int, int, GlossaryManager]] = {}
+
 
 @dataclass
 class GlossaryRule:
@@ -28,6 +58,20 @@ class GlossaryRule:
     word_boundary: bool = True
     description: str | None = None
     _compiled: re.Pattern[str] | None = field(init=False, default=None, repr=False)
+    # Settings the cached pattern was compiled from; a mismatch forces a recompile
+    _compiled_key: tuple[str, str, bool, bool] | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+    # (trigger, priority) from the last sort_key() call, reused until the trigger changes
+    _sort_key: tuple[str, tuple[int, int]] | None = field(
+        init=False, default=None, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Large glossaries map many triggers to the same replacement; interning
+        # shares one string object per distinct value across rules
+        self.trigger = sys.intern(self.trigger)
+        self.replacement = sys.intern(self.replacement)
 
     def to_dict(self) -> dict:
         """Serialize the rule to a JSON-friendly dict."""
@@ -54,24 +98,41 @@ class GlossaryRule:
             description=data.get("description"),
         )
 
-    def compile_pattern(self) -> re.Pattern[str]:
-        """Compile and cache a regex pattern for the rule."""
-
-        if self._compiled:
-            return self._compiled
+    def pattern_source(self) -> str:
+        """Return the regex source for the rule, without case flags."""
 
-        flags = 0 if self.case_sensitive else re.IGNORECASE
         if self.match_type == "regex":
-            self._compiled = re.compile(self.trigger, flags)
-            return self._compiled
+            return self.trigger
 
         escaped = re.escape(self.trigger.strip())
         if self.word_boundary:
-            pattern = rf"\b{escaped}\b"
-        else:
-            pattern = escaped
+            return rf"\b{escaped}\b"
+        return escaped
+
+    def sort_key(self) -> tuple[int, int]:
+        """Return the priority key: more words first, then longer triggers."""
+
+        cached = self._sort_key
+        if cached is not None and cached[0] == self.trigger:
+            return cached[1]
+
+        key = (-len(self.trigger.split()), -len(self.trigger))
+        self._sort_key = (self.trigger, key)
+        return key
+
+    def compile_pattern(self) -> re.Pattern[str]:
+        """Compile and cache a regex pattern for the rule.
+
+        The cached pattern is reused until the trigger, match type, or flags change.
+        """
+
+        key = (self.trigger, self.match_type, self.case_sensitive, self.word_boundary)
+        if self._compiled is not None and self._compiled_key == key:
+            return self._compiled
 
-        self._compiled = re.compile(pattern, flags)
+        flags = 0 if self.case_sensitive else re.IGNORECASE
+        self._compiled = re.compile(self.pattern_source(), flags)
+        self._compiled_key = key
         return self._compiled
 
 
@@ -82,6 +143,16 @@ class GlossaryManager:
         self.rules: list[GlossaryRule] = [
             rule for rule in (rules or []) if rule.trigger.strip() and rule.replacement.strip()
         ]
+        # Rules merged into one alternation plus those applied one at a time,
+        # built on first apply() and reset whenever the rule list changes
+        self._combined_pattern: re.Pattern[str] | None = None
+        self._combined_replacements: list[str] | None = None
+        self._separate_rules: list[GlossaryRule] = []
+        # Casefolded first characters of the merged triggers; None if any merged
+        # rule is a regex, whose first character cannot be known up front
+        self._trigger_firsts: frozenset[str] | None = None
+        # Lowercased trigger -> position in self.rules, rebuilt on every sort
+        self._index: dict[str, int] = {}
         self._sort_rules()
 
     # ------------------------------------------------------------------
@@ -92,28 +163,48 @@ class GlossaryManager:
         """Load glossary rules from disk.
 
         JSON is preferred, but we also parse legacy "trigger => replacement" text.
+        While the file's modification time and size are unchanged, the previously
+        loaded manager is returned without re-reading the file.
         """
 
         path = path or GLOSSARY_FILE
 
-        if not path.is_file():
+        try:
+            stat_result = path.stat()
+        except OSError:
+            # Missing file (or unreadable parent directory): start empty
             return cls()
+        if not S_ISREG(stat_result.st_mode):
+            return cls()
+
+        key = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = _LOAD_CACHE.get(path)
+        if cached is not None and cached[:2] == key:
+            return cached[2]
 
         try:
             content = path.read_text(encoding="utf-8")
         except (OSError, UnicodeDecodeError) as e:  # pragma: no cover
             # OSError: File access errors
             # UnicodeDecodeError: Invalid UTF-8 encoding
-            print(f"(Glossary) Could not read saved glossary: {e}")
+            logger.warning("Could not read saved glossary: %s", e)
             return cls()
 
+        manager = cls._parse(content)
+        _LOAD_CACHE[path] = (*key, manager)
+        return manager
+
+    @classmethod
+    def _parse(cls, content: str) -> GlossaryManager:
+        """Build a manager from JSON or legacy "trigger => replacement" text."""
+
         content = content.strip()
         if not content:
             return cls()
 
-        # Prefer structured JSON
+        # Prefer structured JSON (orjson.JSONDecodeError subclasses the stdlib one)
         try:
-            data = json.loads(content)
+            data = orjson.loads(content) if orjson is not None else json.loads(content)
             if isinstance(data, list):
                 return cls(GlossaryRule.from_dict(item) for item in data)
         except json.JSONDecodeError:
@@ -122,24 +213,38 @@ class GlossaryManager:
         # Fallback to legacy text format
         return cls(_parse_legacy_rules(content))
 
-    def save(self, path: Path | None = None) -> bool:
-        """Persist glossary rules to disk as JSON."""
+    def save(self, path: Path | None = None, fsync: bool = False) -> bool:
+        """Persist glossary rules to disk as JSON.
+
+        The file is written to a temporary sibling and swapped in with os.replace,
+        so a crash mid-write leaves either the old or the new glossary, never a
+        truncated one. Pass fsync=True to also flush the data to disk before the
+        swap (slower; only needed to survive power loss).
+        """
 
         path = path or GLOSSARY_FILE
+        tmp_path = path.with_name(f"{path.name}.tmp")
 
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            payload = json.dumps(
-                [rule.to_dict() for rule in self.rules], indent=2, ensure_ascii=False
-            )
-            path.write_text(payload, encoding="utf-8")
+            payload = _encode_rules([rule.to_dict() for rule in self.rules])
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+            stat_result = path.stat()
+            _LOAD_CACHE[path] = (stat_result.st_mtime_ns, stat_result.st_size, self)
             return True
         except (OSError, UnicodeEncodeError, TypeError, ValueError) as e:  # pragma: no cover
             # OSError: File/directory write errors
             # UnicodeEncodeError: Invalid character encoding
-            # TypeError: Non-serializable values in rules
+            # TypeError: Non-serializable values in rules (orjson.JSONEncodeError included)
             # ValueError: Invalid JSON structure
-            print(f"(Glossary) Could not save glossary: {e}")
+            logger.warning("Could not save glossary: %s", e)
+            with suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
             return False
 
     # ------------------------------------------------------------------
@@ -148,19 +253,29 @@ class GlossaryManager:
     def upsert_rule(self, rule: GlossaryRule) -> None:
         """Add or replace a rule with the same trigger (case-insensitive)."""
 
-        for idx, existing in enumerate(self.rules):
-            if existing.trigger.lower() == rule.trigger.lower():
-                self.rules[idx] = rule
-                self._sort_rules()
-                return
-        self.rules.append(rule)
+        self._upsert_unsorted(rule)
         self._sort_rules()
 
+    def _upsert_unsorted(self, rule: GlossaryRule) -> None:
+        """Add or replace a rule via the trigger index, leaving the list unsorted."""
+
+        lowered = rule.trigger.lower()
+        idx = self._index.get(lowered)
+        if idx is not None:
+            self.rules[idx] = rule
+        else:
+            self._index[lowered] = len(self.rules)
+            self.rules.append(rule)
+
     def remove_rule(self, trigger: str) -> None:
         """Remove a rule by trigger text (case-insensitive)."""
 
         lowered = trigger.lower()
+        if lowered not in self._index:
+            return
+        # Filter rather than delete one index: rules loaded from disk may repeat a trigger
         self.rules = [rule for rule in self.rules if rule.trigger.lower() != lowered]
+        self._sort_rules()
 
     def import_csv(self, csv_text: str) -> None:
         """Import rules from CSV text (trigger,replacement,match_type,case_sensitive,word_boundary)."""
@@ -175,10 +290,12 @@ class GlossaryManager:
                 trigger=trigger,
                 replacement=replacement,
                 match_type=row.get("match_type") or "phrase",
-                case_sensitive=str(row.get("case_sensitive", "")).lower() == "true",
-                word_boundary=str(row.get("word_boundary", "true")).lower() != "false",
+                case_sensitive=_csv_flag(row.get("case_sensitive"), default=False),
+                word_boundary=_csv_flag(row.get("word_boundary"), default=True),
             )
-            self.upsert_rule(rule)
+            self._upsert_unsorted(rule)
+        # Sort once for the whole import instead of after every row
+        self._sort_rules()
 
     def export_csv(self) -> str:
         """Export rules as CSV text."""
@@ -187,37 +304,61 @@ class GlossaryManager:
             return ""
 
         buffer = StringIO()
-        writer = csv.DictWriter(
-            buffer,
-            fieldnames=[
-                "trigger",
-                "replacement",
-                "match_type",
-                "case_sensitive",
-                "word_boundary",
-                "description",
-            ],
-        )
-        writer.writeheader()
-        for rule in self.rules:
-            writer.writerow(
-                {
-                    "trigger": rule.trigger,
-                    "replacement": rule.replacement,
-                    "match_type": rule.match_type,
-                    "case_sensitive": str(rule.case_sensitive).lower(),
-                    "word_boundary": str(rule.word_boundary).lower(),
-                    "description": rule.description or "",
-                }
+        writer = csv.writer(buffer)
+        writer.writerow(_CSV_FIELDS)
+        # Positional rows fed to writerows() keep the loop inside the C csv module
+        writer.writerows(
+            (
+                rule.trigger,
+                rule.replacement,
+                rule.match_type,
+                "true" if rule.case_sensitive else "false",
+                "true" if rule.word_boundary else "false",
+                rule.description or "",
             )
+            for rule in self.rules
+        )
         return buffer.getvalue().strip()
 
     def _sort_rules(self) -> None:
-        """Prioritize longer triggers first to avoid partial matches."""
+        """Prioritize longer triggers first to avoid partial matches.
 
-        self.rules.sort(key=lambda r: (-len(r.trigger.split()), -len(r.trigger)))
-        for rule in self.rules:
-            rule._compiled = None
+        The order breaks ties between rules that match at the same position;
+        apply() scans left to right, so an earlier match still wins.
+        """
+
+        self.rules.sort(key=GlossaryRule.sort_key)
+        self._index = {rule.trigger.lower(): idx for idx, rule in enumerate(self.rules)}
+        self._combined_replacements = None
+
+    def _build_combined_pattern(self) -> tuple[re.Pattern[str] | None, list[str]]:
+        """Merge rules into a single alternation so apply() scans the text once.
+
+        Each merged rule becomes one capturing group, in priority order, and
+        m.lastindex identifies the rule that matched. Case-insensitive rules are
+        scoped with (?i:...). Because the scan is a single pass, the leftmost match
+        wins and rule priority only decides between matches starting at the same
+        position: with "a b c" -> X and "x a" -> Y, "x a b c" becomes "Y b c". Regex rules with their own groups or a templated
+        replacement (backslash escapes, backreferences) are kept separate.
+        """
+
+        if self._combined_replacements is not None:
+            return self._combined_pattern, self._combined_replacements
+
+        merged = [rule for rule in self.rules if _is_mergeable(rule)]
+        try:
+            pattern = _compile_alternation(merged)
+        except re.error:
+            # e.g. a regex trigger with global inline flags such as "(?i)..."
+            merged = [rule for rule in merged if rule.match_type != "regex"]
+            pattern = _compile_alternation(merged)
+
+        self._trigger_firsts = _trigger_first_chars(merged)
+        merged_ids = {id(rule) for rule in merged}
+        self._separate_rules = [rule for rule in self.rules if id(rule) not in merged_ids]
+        self._combined_pattern = pattern
+        self._combined_replacements = [rule.replacement for rule in merged]
+        return pattern, self._combined_replacements
 
     # ------------------------------------------------------------------
     # Application
@@ -229,11 +370,38 @@ class GlossaryManager:
             return text
 
         result = text
-        for rule in self.rules:
-            pattern = rule.compile_pattern()
-            result = pattern.sub(rule.replacement, result)
+        combined_pattern, replacements = self._build_combined_pattern()
+        # Cheap prefilter: a trigger cannot match if the text lacks its first
+        # character, so most short dictations skip the regex scan entirely
+        firsts = self._trigger_firsts
+        if firsts is not None and firsts.isdisjoint(text.casefold()):
+            combined_pattern = None
+
+        if combined_pattern is not None:
+
+            def replace(match: re.Match[str]) -> str:
+                # Every alternative is exactly one group, so lastindex names the rule
+                return replacements[cast(int, match.lastindex) - 1]
+
+            result = combined_pattern.sub(replace, result)
+
+        for rule in self._separate_rules:
+            result = rule.compile_pattern().sub(rule.replacement, result)
         return result
 
+    def warm_up(self) -> None:
+        """Compile every pattern apply() will need, ahead of the first dictation.
+
+        Safe to run on a background thread: it only builds caches that apply()
+        would otherwise build on first use. Invalid regex rules are skipped here
+        and reported when apply() reaches them.
+        """
+
+        self._build_combined_pattern()
+        for rule in self._separate_rules:
+            with suppress(re.error):
+                rule.compile_pattern()
+
     def format_for_prompt(self) -> str:
         """Render a concise prompt block describing the glossary rules."""
 
@@ -274,39 +442,106 @@ def load_glossary_manager() -> GlossaryManager:
     return GlossaryManager.load()
 
 
-def write_saved_glossary(glossary_text: str) -> bool:
+def write_saved_glossary(glossary_text: str, fsync: bool = False) -> bool:
     """Persist glossary text (legacy format) as structured JSON."""
 
     rules = _parse_legacy_rules(glossary_text)
     manager = GlossaryManager(rules)
-    return manager.save()
+    return manager.save(fsync=fsync)
 
 
 def apply_glossary(text: str, manager: GlossaryManager | None) -> str:
     """Apply glossary normalization when a manager is present."""
 
-    if manager is None:
+    if manager is None or not text or not manager.rules:
         return text
     return manager.apply(text)
 
 
+def _encode_rules(rules: list[dict]) -> bytes:
+    """Serialize rules to indented UTF-8 JSON, using orjson when available."""
+
+    if orjson is not None:
+        return orjson.dumps(rules, option=orjson.OPT_INDENT_2)
+    return json.dumps(rules, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _is_mergeable(rule: GlossaryRule) -> bool:
+    """Return True if a rule can join the combined alternation unchanged."""
+
+    if rule.match_type != "regex":
+        return True
+    if "\\" in rule.replacement:
+        # Template escapes and backreferences need the rule's own re.sub
+        return False
+    try:
+        return rule.compile_pattern().groups == 0
+    except re.error:
+        # Invalid pattern: leave it to the per-rule path, which reports the error
+        return False
+
+
+def _trigger_first_chars(rules: list[GlossaryRule]) -> frozenset[str] | None:
+    """Return the casefolded first characters of literal triggers, or None.
+
+    None disables the apply() prefilter. Regex triggers can start with anything,
+    and re.IGNORECASE folds non-ASCII letters differently from str.casefold()
+    ("I" matches "ı", yet "I".casefold() == "i"), so only ASCII first characters
+    are trusted. The one ASCII letter with an extra IGNORECASE partner is "i",
+    which also matches the dotless "ı".
+    """
+
+    firsts: set[str] = set()
+    for rule in rules:
+        if rule.match_type == "regex":
+            return None
+        first = rule.trigger.strip().casefold()[:1]
+        if not first.isascii():
+            return None
+        firsts.add(first)
+    if "i" in firsts:
+        firsts.add("ı")
+    return frozenset(firsts)
+
+
+def _compile_alternation(rules: list[GlossaryRule]) -> re.Pattern[str] | None:
+    """Compile rules into one alternation with a capturing group per rule."""
+
+    parts: list[str] = []
+    for rule in rules:
+        group = f"({rule.pattern_source()})"
+        parts.append(group if rule.case_sensitive else f"(?i:{group})")
+    return re.compile("|".join(parts)) if parts else None
+
+
 # ----------------------------------------------------------------------
 # Parsing helpers
 # ----------------------------------------------------------------------
+def _csv_flag(value: str | None, default: bool) -> bool:
+    """Read a boolean CSV cell, falling back to default when blank or unrecognized."""
+
+    if not value:
+        return default
+    value = value.strip().lower()
+    if default:
+        return value not in _CSV_FALSE
+    return value in _CSV_TRUE
+
+
 def _parse_legacy_rules(text: str) -> list[GlossaryRule]:
     """Parse simple `trigger => replacement` lines into rules."""
 
     rules: list[GlossaryRule] = []
     for line in text.splitlines():
         cleaned = line.strip()
-        if not cleaned or cleaned.startswith("#"):
-            continue
-        if "=>" in cleaned:
-            trigger, replacement = cleaned.split("=>", 1)
-        elif "=" in cleaned:
-            trigger, replacement = cleaned.split("=", 1)
-        else:
+        if not cleaned or cleaned[0] == "#":
             continue
+        # partition() scans once and never builds a list, unlike "in" + split()
+        trigger, sep, replacement = cleaned.partition("=>")
+        if not sep:
+            trigger, sep, replacement = cleaned.partition("=")
+            if not sep:
+                continue
         trigger = trigger.strip()
         replacement = replacement.strip()
         if trigger and replacement:
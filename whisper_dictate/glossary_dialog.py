@@ -51,6 +51,8 @@ class GlossaryDialog(Toplevel):
             self.tree.heading(col, text=heading)
             self.tree.column(col, width=width, anchor="w")
         self.tree.grid(row=1, column=0, sticky="nsew", padx=12)
+        # Values currently shown per row; iids are "rule-<index into manager.rules>"
+        self._tree_rows: list[tuple[str, str, str, str, str]] = []
 
         btns = ttk.Frame(self)
         btns.grid(row=2, column=0, sticky="ew", padx=12, pady=10)
@@ -80,21 +82,29 @@ class GlossaryDialog(Toplevel):
     # Tree helpers
     # ------------------------------------------------------------------
     def _refresh_tree(self) -> None:
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        for idx, rule in enumerate(self.manager.rules):
-            self.tree.insert(
-                "",
-                "end",
-                iid=f"rule-{idx}",
-                values=(
-                    rule.trigger,
-                    rule.replacement,
-                    rule.match_type,
-                    "Yes" if rule.case_sensitive else "No",
-                    "Yes" if rule.word_boundary else "No",
-                ),
+        """Sync the tree with the rules, touching only rows whose values changed."""
+
+        rows: list[tuple[str, str, str, str, str]] = [
+            (
+                rule.trigger,
+                rule.replacement,
+                rule.match_type,
+                "Yes" if rule.case_sensitive else "No",
+                "Yes" if rule.word_boundary else "No",
             )
+            for rule in self.manager.rules
+        ]
+        shown = self._tree_rows
+        for idx, values in enumerate(rows[: len(shown)]):
+            if values != shown[idx]:
+                self.tree.item(f"rule-{idx}", values=values)
+        for idx in range(len(shown), len(rows)):
+            self.tree.insert("", "end", iid=f"rule-{idx}", values=rows[idx])
+        for idx in range(len(rows), len(shown)):
+            self.tree.delete(f"rule-{idx}")
+        self._tree_rows = rows
+        # Row ids are positions, so a kept selection could now point at another rule
+        self.tree.selection_remove(self.tree.selection())
 
     def _selected_rule(self) -> GlossaryRule | None:
         selection = self.tree.selection()
@@ -3,19 +3,25 @@
 import threading
 import time
 from collections import deque
-
-try:
-    import pyautogui
-
-    pyautogui.FAILSAFE = False
-except ImportError:
-    pyautogui = None
-
-from tkinter import END, BooleanVar, DoubleVar, Menu, StringVar, Text, Tk, Toplevel, messagebox, ttk
+from functools import lru_cache
+from tkinter import (
+    END,
+    BooleanVar,
+    DoubleVar,
+    IntVar,
+    Menu,
+    StringVar,
+    TclError,
+    Text,
+    Tk,
+    Toplevel,
+    messagebox,
+    ttk,
+)
+from typing import TYPE_CHECKING, Any
 
 import pyperclip
 import sounddevice as sd
-from faster_whisper import WhisperModel
 
 from whisper_dictate import (
     app_context,
@@ -24,6 +30,7 @@ from whisper_dictate import (
     config,
     glossary,
     hotkeys,
+    keyboard_input,
     llm_cleanup,
     prompt,
     settings_store,
@@ -35,6 +42,8 @@ from whisper_dictate.config import (
     DEFAULT_AUTO_REGISTER_HOTKEY,
     DEFAULT_COMPUTE,
     DEFAULT_DEVICE,
+    DEFAULT_LLM_BYPASS_UNDER_CHARS,
+    DEFAULT_LLM_BYPASS_UNDER_WORDS,
     DEFAULT_LLM_DEBUG,
     DEFAULT_LLM_ENABLED,
     DEFAULT_LLM_ENDPOINT,
@@ -43,8 +52,8 @@ from whisper_dictate.config import (
     DEFAULT_LLM_PROMPT,
     DEFAULT_LLM_TEMP,
     DEFAULT_MODEL,
-    DEVICE_COMPUTE_DEFAULTS,
     MODEL_INFO,
+    get_default_compute,
     get_model_choices,
     set_cuda_paths,
 )
@@ -52,6 +61,21 @@ from whisper_dictate.glossary_dialog import GlossaryDialog
 from whisper_dictate.gui_components import PromptDialog, StatusIndicator
 from whisper_dictate.logging_config import LOG_FILE, setup_logging
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+
+@lru_cache(maxsize=1)
+def _load_pyautogui() -> Any:
+    """Import pyautogui on first auto-paste fallback; returns None if unavailable."""
+    try:
+        import pyautogui
+    except ImportError:
+        return None
+    pyautogui.FAILSAFE = False
+    return pyautogui
+
+
 # Set up CUDA paths before importing other modules
 set_cuda_paths()
 
@@ -82,7 +106,10 @@ class App(Tk):
         # Load saved prompt
         self.prompt_content = prompt.load_saved_prompt()
         self.glossary_manager = glossary.load_glossary_manager()
+        # Compile glossary patterns while the window is still being built
+        threading.Thread(target=self.glossary_manager.warm_up, daemon=True).start()
         self.app_prompts: app_prompts.AppPromptMap = {}
+        self._compiled_app_prompts = app_prompts.CompiledAppPrompts()
         self.recent_processes: deque[dict[str, str | None]] = deque(
             maxlen=self.RECENT_PROCESSES_MAX
         )
@@ -149,6 +176,8 @@ class App(Tk):
         self.var_llm_key = StringVar(value=DEFAULT_LLM_KEY)
         self.var_llm_temp = DoubleVar(value=DEFAULT_LLM_TEMP)
         self.var_llm_debug = BooleanVar(value=DEFAULT_LLM_DEBUG)
+        self.var_llm_bypass_chars = IntVar(value=DEFAULT_LLM_BYPASS_UNDER_CHARS)
+        self.var_llm_bypass_words = IntVar(value=DEFAULT_LLM_BYPASS_UNDER_WORDS)
         self.var_glossary_enable = BooleanVar(value=True)
         self.var_auto_load_model = BooleanVar(value=DEFAULT_AUTO_LOAD_MODEL)
         self.var_auto_register_hotkey = BooleanVar(value=DEFAULT_AUTO_REGISTER_HOTKEY)
@@ -256,6 +285,27 @@ class App(Tk):
             )
             self._add_labeled_widget(frame, "Input device", 4, input_combo)
 
+            def update_compute_type() -> None:
+                """Pick the recommended compute type for the selected device and model."""
+                device, model_id = self.var_device.get(), self.var_model.get()
+
+                # The first query per device imports CTranslate2 and probes the
+                # hardware, so keep it off the Tk thread
+                def worker() -> None:
+                    new_compute = get_default_compute(device, model_id)
+
+                    def apply() -> None:
+                        # Drop answers for a selection the user has since changed
+                        if (self.var_device.get(), self.var_model.get()) != (device, model_id):
+                            return
+                        self.var_compute.set(new_compute)
+                        if compute_label.winfo_exists():
+                            compute_label.config(text=f"Compute type: {new_compute} (auto)")
+
+                    self.after(0, apply)
+
+                threading.Thread(target=worker, daemon=True).start()
+
             def update_model_display(*args) -> None:
                 """Update model dropdown values when device changes."""
                 current_model = self.var_model.get()
@@ -265,9 +315,7 @@ class App(Tk):
                 model_combo.config(values=display_names)
 
                 # Update compute type automatically
-                new_compute = DEVICE_COMPUTE_DEFAULTS.get(device, "float16")
-                self.var_compute.set(new_compute)
-                compute_label.config(text=f"Compute type: {new_compute} (auto)")
+                update_compute_type()
 
                 # Maintain selection if model still exists
                 for model_id, display in choices:
@@ -287,6 +335,7 @@ class App(Tk):
                 for model_id, disp in get_model_choices(device):
                     if disp == display:
                         self.var_model.set(model_id)
+                        update_compute_type()
                         info = MODEL_INFO.get(model_id, {})
                         desc = info.get("description", "")
                         speed = info.get("speed", "")
@@ -395,9 +444,19 @@ class App(Tk):
                     frame, from_=0.0, to=1.5, increment=0.1, textvariable=self.var_llm_temp, width=6
                 ),
             )
+            bypass_row = ttk.Frame(frame)
+            ttk.Spinbox(
+                bypass_row, from_=0, to=200, textvariable=self.var_llm_bypass_chars, width=5
+            ).pack(side="left")
+            ttk.Label(bypass_row, text="characters or").pack(side="left", padx=6)
+            ttk.Spinbox(
+                bypass_row, from_=0, to=20, textvariable=self.var_llm_bypass_words, width=4
+            ).pack(side="left")
+            ttk.Label(bypass_row, text="words (0 = always clean)").pack(side="left", padx=6)
+            self._add_labeled_widget(frame, "Skip LLM under", 5, bypass_row)
             ttk.Checkbutton(
                 frame, text="Log full LLM prompts for debugging", variable=self.var_llm_debug
-            ).grid(row=5, column=0, columnspan=2, sticky="w")
+            ).grid(row=6, column=0, columnspan=2, sticky="w")
             ttk.Label(
                 frame,
                 text="⚠ Warning: Debug mode logs transcribed speech and prompts to disk",
@@ -405,22 +464,22 @@ class App(Tk):
                 wraplength=440,
                 justify="left",
                 font=("Segoe UI", 9, "italic"),
-            ).grid(row=6, column=0, columnspan=2, sticky="w", padx=(20, 0))
+            ).grid(row=7, column=0, columnspan=2, sticky="w", padx=(20, 0))
             ttk.Checkbutton(
                 frame, text="Use glossary before prompt", variable=self.var_glossary_enable
-            ).grid(row=7, column=0, columnspan=2, sticky="w")
+            ).grid(row=8, column=0, columnspan=2, sticky="w")
             ttk.Label(
                 frame,
                 text=f"Cleanup prompt saved to {prompt.PROMPT_FILE} (Edit → Prompt…)",
                 wraplength=440,
                 justify="left",
-            ).grid(row=8, column=0, columnspan=2, sticky="w", pady=(8, 0))
+            ).grid(row=9, column=0, columnspan=2, sticky="w", pady=(8, 0))
             ttk.Label(
                 frame,
                 text=f"Glossary saved to {glossary.GLOSSARY_FILE} (Edit → Glossary…)",
                 wraplength=440,
                 justify="left",
-            ).grid(row=9, column=0, columnspan=2, sticky="w")
+            ).grid(row=10, column=0, columnspan=2, sticky="w")
 
         self._open_window("_llm_window", "LLM cleanup", build)
 
@@ -585,13 +644,16 @@ class App(Tk):
 
                 self._set_status("processing", f"Auto-loading {model_name}...")
                 self.model = transcription.load_model(model_name, device, compute)
+                transcription.warm_up_model(self.model)
+
+                active_compute = transcription.resolved_compute_type(self.model) or compute
 
                 def on_success():
-                    self._set_status("ready", "Model ready (auto-loaded)")
+                    self._set_status("ready", f"Model ready (auto-loaded, {active_compute})")
                     self.btn_load.config(state="disabled")
                     self.btn_hotkey.config(state="normal")
                     self.btn_toggle.config(state="normal")
-                    logger.info(f"Auto-loaded model: {model_name} on {device} ({compute})")
+                    logger.info(f"Auto-loaded model: {model_name} on {device} ({active_compute})")
 
                     # Auto-register hotkey if enabled
                     if self.var_auto_register_hotkey.get():
@@ -599,12 +661,16 @@ class App(Tk):
 
                 self.after(0, on_success)
 
-            except (OSError, RuntimeError, ValueError) as e:
+            except Exception as e:
+                # Broad on purpose: faster_whisper/ctranslate2 are first imported here,
+                # so ImportError ("DLL load failed") arrives alongside the usual
+                # OSError/RuntimeError/ValueError, and an uncaught error would end the
+                # thread silently with the status stuck on "Auto-loading..."
+                logger.error(f"Auto-load model failed: {e}", exc_info=True)
                 error_msg = str(e)
 
                 def on_error():
                     self._set_status("error", "Auto-load failed")
-                    logger.error(f"Auto-load model failed: {error_msg}", exc_info=True)
                     messagebox.showerror(
                         "Auto-load error",
                         f"Failed to auto-load model:\n{error_msg}\n\nYou can try loading manually.",
@@ -655,7 +721,7 @@ class App(Tk):
         if not saved:
             return
 
-        self.app_prompts = app_prompts.normalize_app_prompts(saved.get("app_prompts", {}))
+        self._set_app_prompts(app_prompts.normalize_app_prompts(saved.get("app_prompts", {})))
         recent = saved.get("recent_processes")
         if isinstance(recent, list):
             for entry in recent:
@@ -721,6 +787,8 @@ class App(Tk):
             self.var_llm_key.set(api_key)
         set_if_present("llm_temp", self.var_llm_temp, float)
         set_if_present("llm_debug", self.var_llm_debug, bool)
+        set_if_present("llm_bypass_under_chars", self.var_llm_bypass_chars, int)
+        set_if_present("llm_bypass_under_words", self.var_llm_bypass_words, int)
         set_if_present("glossary_enable", self.var_glossary_enable, bool)
         set_if_present("auto_load_model", self.var_auto_load_model, bool)
         set_if_present("auto_register_hotkey", self.var_auto_register_hotkey, bool)
@@ -733,6 +801,7 @@ class App(Tk):
 
     def _save_settings(self) -> None:
         """Persist current settings to disk."""
+        bypass_chars, bypass_words = self._llm_bypass_thresholds()
         settings = {
             "model": self.var_model.get().strip(),
             "device": self.var_device.get().strip(),
@@ -749,6 +818,8 @@ class App(Tk):
             "llm_key": self.var_llm_key.get(),
             "llm_temp": float(self.var_llm_temp.get()),
             "llm_debug": bool(self.var_llm_debug.get()),
+            "llm_bypass_under_chars": bypass_chars,
+            "llm_bypass_under_words": bypass_words,
             "glossary_enable": bool(self.var_glossary_enable.get()),
             "auto_load_model": bool(self.var_auto_load_model.get()),
             "auto_register_hotkey": bool(self.var_auto_register_hotkey.get()),
@@ -771,6 +842,25 @@ class App(Tk):
         if not settings_store.save_settings(settings):
             logger.warning("Could not save settings to disk")
 
+    def _llm_bypass_thresholds(self) -> tuple[int, int]:
+        """Return the LLM bypass thresholds, falling back to defaults on bad input.
+
+        Must be called on the Tk thread: the spinboxes accept free text, so the
+        IntVars raise ``TclError`` when left empty or non-numeric.
+        """
+
+        def read(var: IntVar, default: int) -> int:
+            try:
+                value = int(var.get())
+            except (TclError, ValueError):
+                return default
+            return value if value >= 0 else default
+
+        return (
+            read(self.var_llm_bypass_chars, DEFAULT_LLM_BYPASS_UNDER_CHARS),
+            read(self.var_llm_bypass_words, DEFAULT_LLM_BYPASS_UNDER_WORDS),
+        )
+
     def _on_close(self) -> None:
         """Handle window close event by saving settings then destroying."""
         try:
@@ -834,7 +924,12 @@ class App(Tk):
         )
         self.wait_window(dialog)
         if dialog.result is not None:
-            self.app_prompts = dialog.result
+            self._set_app_prompts(dialog.result)
+
+    def _set_app_prompts(self, rules: app_prompts.AppPromptMap) -> None:
+        """Replace the app prompt rules and recompile their window title regexes."""
+        self.app_prompts = rules
+        self._compiled_app_prompts = app_prompts.compile_app_prompts(rules)
 
     def _get_input_device_names(self) -> list[str]:
         """Get list of available audio input devices for dropdown.
@@ -892,22 +987,44 @@ class App(Tk):
         if device_id is not None:
             sd.default.device = (device_id, None)
 
-        try:
-            self._set_status("processing", f"Loading {model_name} on {device} ({compute})")
-            self.update_idletasks()
-            self.model = transcription.load_model(model_name, device, compute)
-            self._set_status("ready", "Model ready")
-            self.btn_load.config(state="disabled")
-            self.btn_hotkey.config(state="normal")
-            self.btn_toggle.config(state="normal")
-            logger.info(f"Model loaded: {model_name} on {device} ({compute})")
-        except (OSError, RuntimeError, ValueError) as e:
-            # OSError: Model file access errors
-            # RuntimeError: CUDA/device initialization errors
-            # ValueError: Invalid model parameters
-            self._set_status("error", "Model load failed")
-            logger.error(f"Model load failed: {e}", exc_info=True)
-            messagebox.showerror("Model error", str(e))
+        # Construct the model off the Tk thread; a first load can take seconds
+        self._set_status("processing", f"Loading {model_name} on {device} ({compute})")
+        self.btn_load.config(state="disabled")
+
+        def worker():
+            try:
+                model = transcription.load_model(model_name, device, compute)
+            except Exception as e:
+                # OSError: Model file access errors
+                # RuntimeError: CUDA/device initialization errors
+                # ValueError: Invalid model parameters
+                # ImportError: faster_whisper/ctranslate2 are first imported here
+                # Anything else must still reach on_error, or Load stays disabled
+                logger.error(f"Model load failed: {e}", exc_info=True)
+                error_msg = str(e)
+
+                def on_error():
+                    self._set_status("error", "Model load failed")
+                    self.btn_load.config(state="normal")
+                    messagebox.showerror("Model error", error_msg)
+
+                self.after(0, on_error)
+                return
+
+            active_compute = transcription.resolved_compute_type(model) or compute
+
+            def on_success():
+                self.model = model
+                self._set_status("ready", f"Model ready ({active_compute})")
+                self.btn_hotkey.config(state="normal")
+                self.btn_toggle.config(state="normal")
+                logger.info(f"Model loaded: {model_name} on {device} ({active_compute})")
+
+            self.after(0, on_success)
+            # The UI and hotkey are usable while the warm-up runs
+            transcription.warm_up_model(model)
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def _register_hotkey(self) -> None:
         """Register the global hotkey."""
@@ -960,20 +1077,34 @@ class App(Tk):
             audio.stop_recording()
             self._set_status("transcribing", "Transcribing...")
             self.btn_toggle.config(text="Start recording")
-            threading.Thread(target=self._transcribe_and_clean, daemon=True).start()
+            threading.Thread(
+                target=self._transcribe_and_clean,
+                args=self._llm_bypass_thresholds(),
+                daemon=True,
+            ).start()
+
+    def _transcribe_and_clean(self, bypass_chars: int, bypass_words: int) -> None:
+        """Transcribe audio and optionally clean with LLM.
 
-    def _transcribe_and_clean(self) -> None:
-        """Transcribe audio and optionally clean with LLM."""
+        Args:
+            bypass_chars: Skip LLM cleanup for text shorter than this many characters
+            bypass_words: Skip LLM cleanup for text with fewer than this many words
+        """
         audio_data = audio.get_audio_buffer()
         if audio_data is None:
             self._set_status("warning", "No audio captured")
             return
+        if audio.is_silent(audio_data):
+            self._set_status("warning", "No speech detected")
+            return
 
         active_context = app_context.get_active_context()
         if active_context and active_context.process_name:
             self._record_recent_process(active_context.process_name, active_context.window_title)
         prompt_context = app_context.format_context_for_prompt(active_context)
-        app_prompt = app_prompts.resolve_app_prompt(self.app_prompts, active_context)
+        app_prompt = app_prompts.resolve_compiled_app_prompt(
+            self._compiled_app_prompts, active_context
+        )
 
         try:
             text = transcription.transcribe_audio(self.model, audio_data)
@@ -1000,6 +1131,11 @@ class App(Tk):
             self.var_llm_enable.get()
             and self.var_llm_endpoint.get().strip()
             and self.var_llm_model.get().strip()
+            and llm_cleanup.needs_llm_cleanup(
+                normalized_text,
+                min_chars=bypass_chars,
+                min_words=bypass_words,
+            )
         ):
             self._set_status("processing", "Cleaning with LLM...")
             try:
@@ -1014,6 +1150,9 @@ class App(Tk):
                     app_prompt=app_prompt,
                     prompt_context=prompt_context,
                     debug_logging=bool(self.var_llm_debug.get()),
+                    on_first_token=lambda: self._set_status(
+                        "processing", "Receiving LLM response..."
+                    ),
                 )
                 if cleaned:
                     final_text = cleaned
@@ -1035,18 +1174,11 @@ class App(Tk):
         try:
             pyperclip.copy(final_text)
             if self.var_auto_paste.get():
-                if pyautogui is None:
+                if keyboard_input.USER32 is None and _load_pyautogui() is None:
                     self._set_status("warning", "pyautogui not installed; cannot auto-paste")
                 else:
                     time.sleep(float(self.var_paste_delay.get()))
-                    try:
-                        pyautogui.hotkey("ctrl", "v")
-                        self._set_status("ready", "Pasted into active window")
-                    except (pyautogui.FailSafeException, pyautogui.PyAutoGUIException) as e:
-                        # FailSafeException: Mouse moved to corner (failsafe triggered)
-                        # PyAutoGUIException: Other pyautogui errors
-                        self._set_status("error", f"Auto-paste failed: {e}")
-                        logger.error(f"Auto-paste failed: {e}", exc_info=True)
+                    self._paste_clipboard()
         except (pyperclip.PyperclipException, RuntimeError) as e:
             # PyperclipException: Clipboard access errors
             # RuntimeError: Other clipboard-related errors
@@ -1055,6 +1187,24 @@ class App(Tk):
         if getattr(self, "_status_state", "ready") not in {"error", "warning"}:
             self._set_status("ready", "Ready")
 
+    def _paste_clipboard(self) -> None:
+        """Paste into the active window, preferring a direct SendInput call."""
+        if keyboard_input.send_paste():
+            self._set_status("ready", "Pasted into active window")
+            return
+        pyautogui = _load_pyautogui()
+        if pyautogui is None:
+            self._set_status("error", "Auto-paste failed: input was blocked")
+            return
+        try:
+            pyautogui.hotkey("ctrl", "v")
+            self._set_status("ready", "Pasted into active window")
+        except (pyautogui.FailSafeException, pyautogui.PyAutoGUIException) as e:
+            # FailSafeException: Mouse moved to corner (failsafe triggered)
+            # PyAutoGUIException: Other pyautogui errors
+            self._set_status("error", f"Auto-paste failed: {e}")
+            logger.error(f"Auto-paste failed: {e}", exc_info=True)
+
     def _record_recent_process(self, process_name: str | None, window_title: str | None) -> None:
         """Track recently seen applications using process and window title."""
 
@@ -2,8 +2,10 @@
 
 import ctypes
 import ctypes.wintypes
+import string
 import threading
 from collections.abc import Callable
+from types import MappingProxyType
 
 # Windows hotkey constants
 user32 = ctypes.windll.user32
@@ -12,9 +14,21 @@ MOD_CONTROL = 0x0002
 MOD_SHIFT = 0x0004
 MOD_WIN = 0x0008
 WM_HOTKEY = 0x0312
+WM_QUIT = 0x0012
 TOGGLE_ID = 1
 
-VK = {c: ord(c) for c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"}
+# Message wait constants
+INFINITE = 0xFFFFFFFF
+QS_HOTKEY = 0x0080
+QS_ALLPOSTMESSAGE = 0x0100  # Wakes for the WM_QUIT posted on unregister
+MWMO_INPUTAVAILABLE = 0x0004
+PM_REMOVE = 0x0001
+
+# Read-only lookup tables for hotkey parsing
+VK = MappingProxyType({c: ord(c) for c in string.ascii_uppercase})
+_MOD_MAP = MappingProxyType(
+    {"CTRL": MOD_CONTROL, "ALT": MOD_ALT, "SHIFT": MOD_SHIFT, "WIN": MOD_WIN}
+)
 
 
 class HotkeyError(Exception):
@@ -43,20 +57,13 @@ def parse_hotkey_string(s: str) -> tuple[int, int]:
     mods = 0
 
     for m in mods_tokens:
-        if m == "CTRL":
-            mods |= MOD_CONTROL
-        elif m == "ALT":
-            mods |= MOD_ALT
-        elif m == "SHIFT":
-            mods |= MOD_SHIFT
-        elif m == "WIN":
-            mods |= MOD_WIN
-        else:
-            raise ValueError(f"Unknown modifier: {m}")
-
-    if len(key) == 1 and key.isalpha():
-        vk = VK[key]
-    else:
+        try:
+            mods |= _MOD_MAP[m]
+        except KeyError:
+            raise ValueError(f"Unknown modifier: {m}") from None
+
+    vk = VK.get(key)
+    if vk is None:
         raise ValueError("Only single A..Z keys supported")
 
     return mods, vk
@@ -103,8 +110,8 @@ class HotkeyManager:
         # If a previous message thread is running, stop it
         if self.msg_thread and self.msg_thread.is_alive():
             try:
-                # Post WM_QUIT to that thread to end GetMessageW
-                ctypes.windll.user32.PostThreadMessageW(self._msg_tid, 0x0012, 0, 0)  # WM_QUIT
+                # Post WM_QUIT to that thread to end its message wait
+                ctypes.windll.user32.PostThreadMessageW(self._msg_tid, WM_QUIT, 0, 0)
             except (OSError, AttributeError):
                 # OSError: Windows API call failed (includes WinError)
                 # AttributeError: Invalid thread ID
@@ -134,7 +141,7 @@ class HotkeyManager:
         self._running = False
         if self._msg_tid:
             try:
-                ctypes.windll.user32.PostThreadMessageW(self._msg_tid, 0x0012, 0, 0)  # WM_QUIT
+                ctypes.windll.user32.PostThreadMessageW(self._msg_tid, WM_QUIT, 0, 0)
             except (OSError, AttributeError):
                 # OSError: Windows API call failed (includes WinError)
                 # AttributeError: Invalid thread ID
@@ -164,14 +171,18 @@ class HotkeyManager:
 
         try:
             msg = ctypes.wintypes.MSG()
+            msg_ref = ctypes.byref(msg)
             while self._running:
-                ret = user32.GetMessageW(ctypes.byref(msg), None, 0, 0)
-                if ret == 0:  # WM_QUIT received
-                    break
-                if msg.message == WM_HOTKEY and msg.wParam == TOGGLE_ID:
-                    # Call callback (caller should handle thread safety)
-                    self.callback()
-                user32.TranslateMessage(ctypes.byref(msg))
-                user32.DispatchMessageW(ctypes.byref(msg))
+                # Sleep in the kernel until a hotkey or posted message arrives
+                user32.MsgWaitForMultipleObjectsEx(
+                    0, None, INFINITE, QS_HOTKEY | QS_ALLPOSTMESSAGE, MWMO_INPUTAVAILABLE
+                )
+                # Drain the queue; thread messages have no window, so no Translate/Dispatch
+                while user32.PeekMessageW(msg_ref, None, 0, 0, PM_REMOVE):
+                    if msg.message == WM_QUIT:
+                        return
+                    if msg.message == WM_HOTKEY and msg.wParam == TOGGLE_ID:
+                        # Call callback (caller should handle thread safety)
+                        self.callback()
         finally:
             user32.UnregisterHotKey(None, TOGGLE_ID)
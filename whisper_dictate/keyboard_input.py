@@ -0,0 +1,94 @@
+"""Synthesize keyboard shortcuts on Windows via SendInput."""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.wintypes
+import sys
+from typing import Any
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_V = 0x56
+
+# Fixed-width aliases so the structure layout is identical on every platform
+LONG = ctypes.c_int32
+DWORD = ctypes.c_uint32
+WORD = ctypes.c_uint16
+ULONG_PTR = ctypes.c_size_t
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", LONG),
+        ("dy", LONG),
+        ("mouseData", DWORD),
+        ("dwFlags", DWORD),
+        ("time", DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", WORD),
+        ("wScan", WORD),
+        ("dwFlags", DWORD),
+        ("time", DWORD),
+        ("dwExtraInfo", ULONG_PTR),
+    ]
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ("uMsg", DWORD),
+        ("wParamL", WORD),
+        ("wParamH", WORD),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member and sets the size SendInput expects
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT), ("hi", HARDWAREINPUT)]
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = [("type", DWORD), ("u", _INPUTUNION)]
+
+
+def _key_event(vk: int, flags: int = 0) -> INPUT:
+    event = INPUT(type=INPUT_KEYBOARD)
+    event.ki = KEYBDINPUT(wVk=vk, dwFlags=flags)
+    return event
+
+
+# Ctrl down, V down, V up, Ctrl up; built once and reused for every paste
+_PASTE_INPUTS = (INPUT * 4)(
+    _key_event(VK_CONTROL),
+    _key_event(VK_V),
+    _key_event(VK_V, KEYEVENTF_KEYUP),
+    _key_event(VK_CONTROL, KEYEVENTF_KEYUP),
+)
+
+# A private user32 handle, so the SendInput prototype is not imposed on other
+# libraries that call it through the shared ctypes.windll.user32. None off Windows.
+USER32: Any = None
+if sys.platform == "win32":
+    USER32 = ctypes.WinDLL("user32", use_last_error=True)
+    USER32.SendInput.argtypes = [ctypes.wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+    USER32.SendInput.restype = ctypes.wintypes.UINT
+
+
+def send_paste() -> bool:
+    """Send Ctrl+V to the foreground window in a single SendInput call.
+
+    Returns:
+        True if all key events were injected, False if unsupported or blocked
+        (e.g. by UIPI when the target runs elevated)
+    """
+    if USER32 is None:
+        return False
+    sent: int = USER32.SendInput(len(_PASTE_INPUTS), _PASTE_INPUTS, ctypes.sizeof(INPUT))
+    return sent == len(_PASTE_INPUTS)
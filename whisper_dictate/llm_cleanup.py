@@ -1,14 +1,37 @@
 """LLM cleanup functionality for text refinement."""
 
+from __future__ import annotations
+
 import logging
+import sys
 import time
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
+from whisper_dictate.config import DEFAULT_LLM_BYPASS_UNDER_CHARS, DEFAULT_LLM_BYPASS_UNDER_WORDS
 from whisper_dictate.glossary import GlossaryManager
 
-try:
+if TYPE_CHECKING:
     from openai import OpenAI
-except ImportError:
-    OpenAI = None  # type: ignore
+
+
+def __getattr__(name: str) -> Any:
+    # The openai package takes ~1 s to import; defer it until the LLM is used
+    if name == "OpenAI":
+        try:
+            import openai
+        except ImportError:
+            openai = None  # type: ignore
+        globals()["OpenAI"] = openai.OpenAI if openai is not None else None
+        return globals()["OpenAI"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _openai_class() -> type[OpenAI] | None:
+    """Return the OpenAI client class, or None if the package is not installed."""
+    openai_class: type[OpenAI] | None = sys.modules[__name__].OpenAI
+    return openai_class
 
 
 logger = logging.getLogger("whisper_dictate")
@@ -18,6 +41,36 @@ class LLMCleanupError(Exception):
     """Raised when LLM cleanup fails."""
 
 
+@lru_cache(maxsize=4)
+def _get_client(endpoint: str, api_key: str | None) -> OpenAI:
+    """Return a shared client per endpoint/key so its HTTP connection pool is reused."""
+    openai_class = _openai_class()
+    # Callers raise LLMCleanupError before getting here when openai is missing
+    assert openai_class is not None
+    return openai_class(base_url=endpoint, api_key=api_key or "sk-no-key")
+
+
+def clear_client_cache() -> None:
+    """Drop cached clients; their connection pools are released when collected."""
+    _get_client.cache_clear()
+
+
+def needs_llm_cleanup(
+    text: str,
+    min_chars: int = DEFAULT_LLM_BYPASS_UNDER_CHARS,
+    min_words: int = DEFAULT_LLM_BYPASS_UNDER_WORDS,
+) -> bool:
+    """Return True if text is long enough to benefit from LLM cleanup.
+
+    Args:
+        text: Transcribed text
+        min_chars: Skip cleanup below this many characters (0 disables)
+        min_words: Skip cleanup below this many words (0 disables)
+    """
+    stripped = text.strip()
+    return len(stripped) >= min_chars and len(stripped.split(maxsplit=min_words)) >= min_words
+
+
 def list_llm_models(endpoint: str, api_key: str | None, timeout: float = 10.0) -> list[str]:
     """
     Retrieve available models from an OpenAI-compatible endpoint.
@@ -33,11 +86,11 @@ def list_llm_models(endpoint: str, api_key: str | None, timeout: float = 10.0) -
     Raises:
         LLMCleanupError: If the client is unavailable or listing fails
     """
-    if OpenAI is None:
+    if _openai_class() is None:
         raise LLMCleanupError("OpenAI client not installed. Run: uv add openai")
 
     try:
-        client = OpenAI(base_url=endpoint, api_key=api_key or "sk-no-key")
+        client = _get_client(endpoint, api_key)
         response = client.models.list(timeout=timeout)
         models = [m.id for m in getattr(response, "data", []) if getattr(m, "id", None)]
         return sorted(set(models))
@@ -57,6 +110,7 @@ def clean_with_llm(
     app_prompt: str | None = None,
     debug_logging: bool = False,
     timeout: float = 15.0,
+    on_first_token: Callable[[], None] | None = None,
 ) -> str | None:
     """
     Send raw_text to an OpenAI-compatible LLM for cleanup.
@@ -73,6 +127,8 @@ def clean_with_llm(
         app_prompt: Optional application-specific prompt appended to the system prompt
         debug_logging: When True, log the full prompt payload before sending
         timeout: Request timeout in seconds
+        on_first_token: Optional callback invoked once when the first content
+            token streams in, so callers can show progress before completion
 
     Returns:
         Cleaned text, or None on failure
@@ -83,7 +139,7 @@ def clean_with_llm(
     if not raw_text.strip():
         return ""
 
-    if OpenAI is None:
+    if _openai_class() is None:
         raise LLMCleanupError("OpenAI client not installed. Run: uv add openai")
 
     if isinstance(glossary, GlossaryManager):
@@ -117,7 +173,8 @@ def clean_with_llm(
         )
 
     try:
-        client = OpenAI(base_url=endpoint, api_key=api_key or "sk-no-key")
+        # Reuse the client so keep-alive connections skip TCP/TLS setup per dictation
+        client = _get_client(endpoint, api_key)
 
         # Start timing
         start_time = time.perf_counter()
@@ -142,6 +199,8 @@ def clean_with_llm(
             if first_token_time is None and chunk.choices:
                 if chunk.choices[0].delta.content:
                     first_token_time = time.perf_counter()
+                    if on_first_token is not None:
+                        on_first_token()
 
             # Collect content
             if chunk.choices:
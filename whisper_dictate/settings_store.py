@@ -2,17 +2,37 @@
 
 import json
 import logging
+import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from whisper_dictate import credentials
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 SETTINGS_FILE = Path.home() / ".whisper_dictate/whisper_dictate_settings.json"
 
 # Settings keys that should be stored securely
-SECURE_KEYS = {"llm_key"}
+SECURE_KEYS: frozenset[str] = frozenset({"llm_key"})
+
+# How long retrieved credentials are reused before asking the keyring again
+CREDENTIAL_CACHE_SECONDS = 60
+
+# First-run settings and their serialized form, so the common save needs no encoding
+_DEFAULT_SETTINGS: dict[str, Any] = {"app_prompts": {}}
+_DEFAULT_SETTINGS_BYTES = b'{\n  "app_prompts": {}\n}'
+
+# Map settings keys to credential keys
+_CREDENTIAL_KEYS: dict[str, str] = {
+    "llm_key": credentials.LLM_API_KEY,
+}
 
 
 def load_settings() -> dict[str, Any]:
@@ -21,20 +41,24 @@ def load_settings() -> dict[str, Any]:
     Automatically migrates plaintext API keys to secure storage if found.
     """
     try:
-        if SETTINGS_FILE.is_file():
-            settings = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
-            if "app_prompts" not in settings:
-                settings["app_prompts"] = {}
-
-            # Migrate plaintext API keys to secure storage
-            _migrate_secure_settings(settings)
-
-            return settings
+        # Open directly rather than probing is_file() first: one syscall, no race
+        settings = json.loads(SETTINGS_FILE.read_bytes())
+        app_prompts = settings.setdefault("app_prompts", {})
+        if app_prompts and isinstance(app_prompts, dict):
+            # Process names are looked up on every dictation; intern them
+            settings["app_prompts"] = {sys.intern(k): v for k, v in app_prompts.items()}
+
+        # Migrate plaintext API keys to secure storage
+        _migrate_secure_settings(settings)
+
+        return settings
+    except FileNotFoundError:
+        pass
     except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:  # pragma: no cover
         # OSError: File access errors
         # UnicodeDecodeError: Invalid UTF-8 encoding
         # JSONDecodeError: Invalid JSON format
-        logger.error(f"Could not read saved settings: {e}")
+        logger.error("Could not read saved settings: %s", e)
     return {"app_prompts": {}}
 
 
@@ -42,7 +66,8 @@ def save_settings(settings: dict[str, Any]) -> bool:
     """Persist settings to disk. Returns True on success, False otherwise.
 
     Secure settings (API keys) are stored in system credential manager
-    and removed from the JSON file.
+    and removed from the JSON file. The write is skipped when the file
+    already holds identical content.
     """
     try:
         # Store secure settings in credential manager
@@ -51,18 +76,40 @@ def save_settings(settings: dict[str, Any]) -> bool:
         # Create a copy without secure keys for JSON storage
         settings_to_save = {k: v for k, v in settings.items() if k not in SECURE_KEYS}
 
+        payload = _encode_settings(settings_to_save)
+        if _read_existing_settings() == payload:
+            # Nothing changed; skip the directory check and write
+            return True
+
         SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        SETTINGS_FILE.write_text(json.dumps(settings_to_save, indent=2), encoding="utf-8")
+        SETTINGS_FILE.write_bytes(payload)
         return True
     except (OSError, UnicodeEncodeError, TypeError, ValueError) as e:  # pragma: no cover
         # OSError: File/directory write errors
         # UnicodeEncodeError: Invalid character encoding
-        # TypeError: Non-serializable values in settings
+        # TypeError: Non-serializable values in settings (orjson.JSONEncodeError included)
         # ValueError: Invalid JSON structure
-        logger.error(f"Could not save settings: {e}")
+        logger.error("Could not save settings: %s", e)
         return False
 
 
+def _encode_settings(settings: dict[str, Any]) -> bytes:
+    """Serialize settings to indented UTF-8 JSON, using orjson when available."""
+    if settings == _DEFAULT_SETTINGS:
+        return _DEFAULT_SETTINGS_BYTES
+    if orjson is not None:
+        return orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    return json.dumps(settings, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _read_existing_settings() -> bytes | None:
+    """Return the current on-disk settings bytes, or None if they cannot be read."""
+    try:
+        return SETTINGS_FILE.read_bytes()
+    except OSError:
+        return None
+
+
 def _migrate_secure_settings(settings: dict[str, Any]) -> None:
     """Migrate plaintext secure settings to credential manager.
 
@@ -79,14 +126,18 @@ def _migrate_secure_settings(settings: dict[str, Any]) -> None:
                     if credentials.migrate_from_plaintext(plaintext_value, credential_key):
                         # Remove from settings dict after successful migration
                         del settings[key]
-                        logger.info(f"Migrated {key} to secure storage")
+                        _cached_retrieve.cache_clear()
+                        logger.info("Migrated %s to secure storage", key)
                 except Exception as e:
-                    logger.warning(f"Failed to migrate {key}: {e}")
+                    logger.warning("Failed to migrate %s: %s", key, e)
 
 
 def _store_secure_settings(settings: dict[str, Any]) -> None:
     """Store secure settings in credential manager.
 
+    Values that match what the credential manager already holds are not
+    rewritten, so saving unrelated settings costs at most a cached read.
+
     Args:
         settings: Settings dictionary
     """
@@ -94,16 +145,25 @@ def _store_secure_settings(settings: dict[str, Any]) -> None:
         if key in settings and settings[key]:
             value = settings[key]
             if isinstance(value, str) and value.strip():
+                credential_key = _get_credential_key(key)
+                try:
+                    if _retrieve_recent(credential_key) == value:
+                        continue
+                except credentials.CredentialStorageError:
+                    pass  # Unknown current value; write it anyway
                 try:
-                    credential_key = _get_credential_key(key)
                     credentials.store_credential(credential_key, value)
+                    _cached_retrieve.cache_clear()
                 except (credentials.CredentialStorageError, ValueError) as e:
-                    logger.warning(f"Failed to store {key} in credential manager: {e}")
+                    logger.warning("Failed to store %s in credential manager: %s", key, e)
 
 
 def get_secure_setting(key: str) -> str | None:
     """Retrieve a secure setting from credential manager.
 
+    Results are reused for up to CREDENTIAL_CACHE_SECONDS to avoid a keyring
+    round-trip on every read; storing a new value invalidates the cache.
+
     Args:
         key: Settings key (e.g., "llm_key")
 
@@ -114,13 +174,23 @@ def get_secure_setting(key: str) -> str | None:
         raise ValueError(f"Key '{key}' is not a secure setting")
 
     try:
-        credential_key = _get_credential_key(key)
-        return credentials.retrieve_credential(credential_key)
+        return _retrieve_recent(_get_credential_key(key))
     except (credentials.CredentialStorageError, ValueError) as e:
-        logger.warning(f"Failed to retrieve {key} from credential manager: {e}")
+        logger.warning("Failed to retrieve %s from credential manager: %s", key, e)
         return None
 
 
+def _retrieve_recent(credential_key: str) -> str | None:
+    """Retrieve a credential, reusing a value read within CREDENTIAL_CACHE_SECONDS."""
+    return _cached_retrieve(credential_key, int(time.monotonic() // CREDENTIAL_CACHE_SECONDS))
+
+
+@lru_cache(maxsize=8)
+def _cached_retrieve(credential_key: str, time_bucket: int) -> str | None:
+    """Retrieve a credential, memoized per key and time bucket."""
+    return credentials.retrieve_credential(credential_key)
+
+
 def _get_credential_key(settings_key: str) -> str:
     """Convert settings key to credential key.
 
@@ -130,8 +200,4 @@ def _get_credential_key(settings_key: str) -> str:
     Returns:
         Credential key for keyring storage (e.g., "llm_api_key")
     """
-    # Map settings keys to credential keys
-    key_mapping = {
-        "llm_key": credentials.LLM_API_KEY,
-    }
-    return key_mapping.get(settings_key, settings_key)
+    return _CREDENTIAL_KEYS.get(settings_key, settings_key)
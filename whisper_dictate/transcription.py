@@ -1,8 +1,56 @@
 """Whisper transcription functionality."""
 
-from faster_whisper import WhisperModel
+from __future__ import annotations
 
-from whisper_dictate.config import normalize_compute_type
+import logging
+import sys
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from whisper_dictate.config import SAMPLE_RATE, normalize_compute_type
+
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+    from faster_whisper.vad import VadOptions
+
+logger = logging.getLogger(__name__)
+
+
+def __getattr__(name: str) -> Any:
+    # faster_whisper pulls in CTranslate2 and tokenizers (~0.5 s); import it on
+    # first use rather than when the GUI starts
+    if name == "WhisperModel":
+        from faster_whisper import WhisperModel
+
+        globals()["WhisperModel"] = WhisperModel
+        return WhisperModel
+    if name == "DEFAULT_VAD_OPTIONS":
+        return _default_vad_options()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _default_vad_options() -> VadOptions:
+    """Silero VAD settings tuned for short dictation; built once and shared across calls."""
+    from faster_whisper.vad import VadOptions
+
+    return VadOptions(
+        threshold=0.5,
+        min_speech_duration_ms=250,
+        min_silence_duration_ms=500,
+        speech_pad_ms=400,
+    )
+
+
+# Greedy decoding, re-decoded at rising temperatures only when a segment looks
+# unreliable (repetitive, low-confidence); far cheaper than beam search for dictation
+DEFAULT_TEMPERATURES = (0.0, 0.2, 0.4, 0.6)
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOG_PROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
 
 
 class TranscriptionError(Exception):
@@ -12,9 +60,11 @@ class TranscriptionError(Exception):
 def transcribe_audio(
     model: WhisperModel,
     audio: bytes | memoryview,
-    beam_size: int = 5,
+    beam_size: int = 1,
     language: str = "en",
-    vad_filter: bool = False,
+    vad_filter: bool = True,
+    vad_parameters: dict | VadOptions | None = None,
+    temperature: float | tuple[float, ...] = DEFAULT_TEMPERATURES,
 ) -> str:
     """
     Transcribe audio using Whisper model.
@@ -22,9 +72,11 @@ def transcribe_audio(
     Args:
         model: Loaded WhisperModel instance
         audio: Audio data as numpy array or compatible format
-        beam_size: Beam size for decoding
+        beam_size: Beam size for decoding (default: 1, greedy)
         language: Language code (default: "en")
-        vad_filter: Whether to use VAD filtering
+        vad_filter: Whether to drop silence with Silero VAD before decoding
+        vad_parameters: VAD options (default: DEFAULT_VAD_OPTIONS when filtering)
+        temperature: Temperature or fallback sequence (default: DEFAULT_TEMPERATURES)
 
     Returns:
         Transcribed text
@@ -32,19 +84,57 @@ def transcribe_audio(
     Raises:
         TranscriptionError: If transcription fails
     """
+    if vad_filter and vad_parameters is None:
+        vad_parameters = _default_vad_options()
+
     try:
         segments, info = model.transcribe(
             audio,
             beam_size=beam_size,
             vad_filter=vad_filter,
+            vad_parameters=vad_parameters,
             language=language,
+            temperature=temperature,
+            compression_ratio_threshold=COMPRESSION_RATIO_THRESHOLD,
+            log_prob_threshold=LOG_PROB_THRESHOLD,
+            no_speech_threshold=NO_SPEECH_THRESHOLD,
+            # Dictations are short; re-feeding earlier segments as a prompt only
+            # lengthens each decode and can propagate hallucinations
+            condition_on_previous_text=False,
+            # Only the text is used, so skip predicting timestamp tokens
+            without_timestamps=True,
         )
-        text = "".join(s.text for s in segments).strip()
-        return text
+        texts = [segment.text for segment in segments]
+        if not texts:
+            return ""
+        return "".join(texts).strip()
     except Exception as e:
         raise TranscriptionError(f"Transcription failed: {e}") from e
 
 
+def warm_up_model(model: WhisperModel) -> None:
+    """Run a throwaway transcription so the first real dictation skips kernel setup.
+
+    Feeds one second of silence through the model and drains the lazy segment
+    generator. Failures are logged and ignored; they will resurface on first use.
+
+    Args:
+        model: Loaded WhisperModel instance
+    """
+    try:
+        segments, _ = model.transcribe(
+            np.zeros(SAMPLE_RATE, dtype=np.float32),
+            beam_size=1,
+            language="en",
+            vad_filter=False,
+            without_timestamps=True,
+        )
+        for _ in segments:
+            pass
+    except Exception as e:
+        logger.debug("Model warm-up failed: %s", e)
+
+
 def load_model(
     model_name: str,
     device: str,
@@ -53,6 +143,11 @@ def load_model(
     """
     Load a Whisper model with normalized compute type.
 
+    The loaded model is cached by (model_name, device, compute_type), so
+    reloading the same configuration reuses the already-initialized model.
+    Switching to a different configuration releases the cached model first,
+    so two large models are never pinned in (GPU) memory at once.
+
     Args:
         model_name: Model name (e.g., "small", "medium", "large-v3")
         device: Device ("cpu" or "cuda")
@@ -61,5 +156,39 @@ def load_model(
     Returns:
         Loaded WhisperModel instance
     """
+    global _cached_model_key
     normalized_compute = normalize_compute_type(device, compute_type)
-    return WhisperModel(model_name, device=device, compute_type=normalized_compute)
+    key = (model_name, device, normalized_compute)
+    with _model_cache_lock:
+        if key != _cached_model_key:
+            # lru_cache would only evict after building the new model
+            _load_cached_model.cache_clear()
+            _cached_model_key = key
+        return _load_cached_model(*key)
+
+
+_model_cache_lock = threading.Lock()
+_cached_model_key: tuple[str, str, str] | None = None
+
+
+@lru_cache(maxsize=1)
+def _load_cached_model(model_name: str, device: str, compute_type: str) -> WhisperModel:
+    """Construct a WhisperModel, caching only the current configuration."""
+    # Resolved through the module so the lazy import (and test patches) apply
+    model_class = sys.modules[__name__].WhisperModel
+    return model_class(model_name, device=device, compute_type=compute_type)
+
+
+def resolved_compute_type(model: WhisperModel) -> str | None:
+    """Return the compute type CTranslate2 actually selected for a loaded model.
+
+    This resolves "auto" and any fallback the backend applied. Returns None if
+    the backend does not report it.
+    """
+    compute_type = getattr(getattr(model, "model", None), "compute_type", None)
+    return compute_type if isinstance(compute_type, str) else None
+
+
+def clear_model_cache() -> None:
+    """Drop cached models so their memory can be reclaimed."""
+    _load_cached_model.cache_clear()